@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
@@ -22,6 +24,7 @@ class UserAdmin(BaseUserAdmin):
                     "is_staff", "is_verified", "is_active")
     list_filter = ("is_staff", "is_superuser", "is_verified", "is_active")
     search_fields = ("email", "first_name", "last_name")
+    show_full_result_count = False
     fieldsets = (
         (None, {"fields": ("email", "password")}),
         (_("Personal info"), {"fields": ("first_name", "last_name")}),
@@ -50,6 +53,7 @@ class UserTokenAdmin(admin.ModelAdmin):
                     "expires_at", "is_used")
     list_filter = ("token_type", "is_used", "created_at")
     search_fields = ("user__email", "token")
+    list_select_related = ("user",)
 
 
 class OAIHarvestLogInline(admin.TabularInline):
@@ -98,6 +102,7 @@ class OAIHarvestLogAdmin(admin.ModelAdmin):
     )
     list_filter = ("status", "journal")
     search_fields = ("journal__name", "endpoint", "error_message")
+    show_full_result_count = False
     readonly_fields = (
         "journal",
         "started_at",
@@ -109,6 +114,12 @@ class OAIHarvestLogAdmin(admin.ModelAdmin):
     )
     ordering = ("-started_at", "-id")
 
+    def get_queryset(self, request):
+        # Error text can hold long tracebacks and is not listed; the detail
+        # page loads it on access. The journal is joined here rather than via
+        # list_select_related so change/delete pages (and __str__) get it too.
+        return super().get_queryset(request).select_related("journal").defer("error_message")
+
     def has_add_permission(self, request):
         return False
 
@@ -117,8 +128,7 @@ class OAIHarvestLogAdmin(admin.ModelAdmin):
 class PublicationAdmin(admin.ModelAdmin):
     list_display = ("title", "journal", "display_creators", "publisher",
                     "issued", "display_languages")
-    list_filter = ("journal", "publisher", "metadata_entries__schema",
-                   "metadata_entries__element")
+    list_filter = ("journal", "publisher")
     search_fields = (
         "title",
         "publisher",
@@ -127,23 +137,37 @@ class PublicationAdmin(admin.ModelAdmin):
         "oai_identifier",
     )
     readonly_fields = ("slug", "created_at", "updated_at")
+    list_select_related = ("journal",)
+    show_full_result_count = False
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
-        return queryset.prefetch_related("metadata_entries")
+        return queryset.select_related("journal").prefetch_related("metadata_entries")
 
     def display_creators(self, obj):
-        values = obj.metadata_values("creator")
-        return ", ".join(values) if values else ""
+        return ", ".join(self._metadata_buckets(obj).get("creator", []))
 
     display_creators.short_description = "Creators"
 
     def display_languages(self, obj):
-        values = obj.metadata_values("language")
-        return ", ".join(values) if values else ""
+        return ", ".join(self._metadata_buckets(obj).get("language", []))
 
     display_languages.short_description = "Languages"
 
+    @staticmethod
+    def _metadata_buckets(obj) -> dict[str, list[str]]:
+        # Walk the prefetched entries once per row and reuse the result for
+        # every metadata column instead of issuing a filtered query each time.
+        buckets = getattr(obj, "_metadata_buckets_cache", None)
+        if buckets is None:
+            buckets = defaultdict(list)
+            for entry in obj.metadata_entries.all():
+                value = (entry.value or "").strip()
+                if entry.schema == "dc" and value:
+                    buckets[entry.element].append(value)
+            obj._metadata_buckets_cache = buckets
+        return buckets
+
 
 class ResearcherExperienceInline(admin.TabularInline):
     model = ResearcherExperience
@@ -197,3 +221,4 @@ class ResearcherInstitutionalEmailTokenAdmin(admin.ModelAdmin):
     )
     list_filter = ("is_used", "created_at")
     search_fields = ("token", "profile__display_name", "email")
+    list_select_related = ("profile",)
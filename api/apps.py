@@ -3,18 +3,34 @@ import logging
 from django.apps import AppConfig
 from django.conf import settings
 
+try:
+    from elastic_transport import ConnectionError as ElasticConnectionError  # type: ignore
+except ImportError:  # pragma: no cover - elasticsearch optional
+    ElasticConnectionError = Exception  # type: ignore[misc]
+
+try:
+    from elasticsearch import ElasticsearchException  # type: ignore
+except ImportError:  # pragma: no cover - elasticsearch optional
+    ElasticsearchException = Exception  # type: ignore[misc]
+
 logger = logging.getLogger(__name__)
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+    # ready() can run more than once per process (e.g. test runners, reloads);
+    # the index only needs to be initialised once.
+    _search_indexes_initialised = False
 
     def ready(self):
         super().ready()
         self._init_search_indexes()
 
     def _init_search_indexes(self) -> None:
+        if ApiConfig._search_indexes_initialised:
+            return
+
         search_settings = getattr(settings, "ELASTICSEARCH_DSL", None)
         if not search_settings:
             return
@@ -23,20 +39,11 @@ class ApiConfig(AppConfig):
         if not default_alias:
             return
 
-        try:
-            from elastic_transport import ConnectionError as ElasticConnectionError  # type: ignore
-        except ImportError:  # pragma: no cover - elasticsearch optional
-            ElasticConnectionError = Exception  # type: ignore[misc]
-
-        try:
-            from elasticsearch import ElasticsearchException  # type: ignore
-        except ImportError:  # pragma: no cover - elasticsearch optional
-            ElasticsearchException = Exception  # type: ignore[misc]
-
         try:
             from .search.publication_index import PublicationDocument
 
             PublicationDocument.init()
+            ApiConfig._search_indexes_initialised = True
         except (ElasticConnectionError, ElasticsearchException) as exc:
             logger.warning(
                 "Skipping Elasticsearch index initialisation: %s", exc)
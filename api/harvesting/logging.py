@@ -61,7 +61,22 @@ class HarvestLogWriter:
         if not self._context.is_closed:
             self._context.mark_failure(reason, record_count)
 
-    def ensure_closed(self, record_count: int = 0) -> None:
-        if not self._context.is_closed:
-            # Default to success if nothing else was recorded, matching previous behaviour
-            self._context.mark_success(record_count)
+    def finalize(self, status: str, record_count: int = 0, error: str = "") -> None:
+        """Close the entry with a single UPDATE, bypassing ``save()`` and signals."""
+        if self._context.is_closed:
+            return
+        entry = self.entry
+        entry.status = status
+        entry.record_count = max(0, record_count)
+        entry.error_message = (
+            OAIHarvestLog.truncate_reason(error)
+            if status == OAIHarvestLog.Status.FAILED
+            else ""
+        )
+        entry.finished_at = timezone.now()
+        OAIHarvestLog.objects.filter(pk=entry.pk).update(
+            status=entry.status,
+            record_count=entry.record_count,
+            error_message=entry.error_message,
+            finished_at=entry.finished_at,
+        )
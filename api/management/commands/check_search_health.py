@@ -1,7 +1,6 @@
-from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
-from elasticsearch import Elasticsearch
 from elasticsearch.exceptions import TransportError
+from elasticsearch_dsl import connections
 
 
 class Command(BaseCommand):
@@ -16,12 +15,9 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        config = settings.ELASTICSEARCH_DSL.get("default", {})
-        hosts = config.get("hosts") or "http://localhost:9200"
-        if isinstance(hosts, str):
-            hosts = [hosts]
-
-        client = Elasticsearch(hosts)
+        # Reuse the client django-elasticsearch-dsl configured from
+        # ELASTICSEARCH_DSL rather than opening a new connection pool.
+        client = connections.get_connection()
         try:
             response = client.cluster.health(
                 request_timeout=options["timeout"])
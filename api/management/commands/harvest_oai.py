@@ -1,25 +1,192 @@
 import logging
-from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, time, timezone as dt_timezone
-from typing import Dict, Iterable, List, Optional, Tuple
-from urllib.error import HTTPError, URLError
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import parse_qs, urlparse, urlunparse
 from xml.etree import ElementTree as ET
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import DataError, IntegrityError, connection, transaction
 from django.utils import timezone
 from django.utils.dateparse import parse_date, parse_datetime
 
 from api.harvesting.logging import HarvestLogWriter
-from api.models import Journal, Publication
-from api.oai import OAI_NAMESPACES, fetch_oai_response
-from api.search.publication_index import PublicationDocument
+from api.models import Journal, OAIHarvestLog, Publication, PublicationMetadata
+from api.oai import OAI_NAMESPACES, OAIClientError, fetch_oai_response
+from api.search.publication_index import PublicationDocument, attach_metadata_rows
+from api.search.refresh import REFRESH_DISABLED, get_refresh_interval, set_refresh_interval
 from api.serializers import PublicationSerializer
 
+try:
+    from lxml import etree as lxml_etree  # type: ignore
+except ImportError:  # pragma: no cover - lxml optional
+    lxml_etree = None
+
 logger = logging.getLogger(__name__)
 
+# Clark-notation tags so ElementTree lookups skip prefix resolution.
+OAI_NS = OAI_NAMESPACES["oai"]
+OAI_DC_NS = OAI_NAMESPACES["oai_dc"]
+RECORD_TAG = f"{{{OAI_NS}}}record"
+HEADER_TAG = f"{{{OAI_NS}}}header"
+METADATA_TAG = f"{{{OAI_NS}}}metadata"
+IDENTIFIER_TAG = f"{{{OAI_NS}}}identifier"
+DATESTAMP_TAG = f"{{{OAI_NS}}}datestamp"
+RESUMPTION_TOKEN_TAG = f"{{{OAI_NS}}}resumptionToken"
+DC_TAG = f"{{{OAI_DC_NS}}}dc"
+DC_ELEMENT_PREFIX = f"{{{OAI_NAMESPACES['dc']}}}"
+DC_ELEMENT_PREFIX_LEN = len(DC_ELEMENT_PREFIX)
+
+if lxml_etree is not None:
+    # Compiled once so each page only pays for the C-level traversal.
+    LXML_PARSER = lxml_etree.XMLParser(
+        resolve_entities=False, no_network=True, remove_comments=True)
+    RECORD_XPATH = lxml_etree.XPath(
+        "//oai:record", namespaces=OAI_NAMESPACES)
+    HEADER_XPATH = lxml_etree.XPath("oai:header", namespaces=OAI_NAMESPACES)
+    DC_NODE_XPATH = lxml_etree.XPath(
+        "oai:metadata/oai_dc:dc", namespaces=OAI_NAMESPACES)
+    CHILD_ELEMENTS_XPATH = lxml_etree.XPath("*")
+    IDENTIFIER_XPATH = lxml_etree.XPath(
+        "string(oai:identifier)", namespaces=OAI_NAMESPACES)
+    DATESTAMP_XPATH = lxml_etree.XPath(
+        "string(oai:datestamp)", namespaces=OAI_NAMESPACES)
+    RESUMPTION_TOKEN_XPATH = lxml_etree.XPath(
+        "string(//oai:resumptionToken)", namespaces=OAI_NAMESPACES)
+
+DEFAULT_HARVEST_WORKERS = 4
+# Dublin Core elements copied verbatim into publication metadata, in order.
+METADATA_ELEMENTS = (
+    "creator",
+    "contributor",
+    "subject",
+    "identifier",
+    "language",
+    "relation",
+    "coverage",
+    "source",
+)
+HARVEST_JOURNAL_FIELDS = ("id", "slug", "name", "oai_url", "last_harvested_at")
+
+# Search index tuning applied for the duration of a harvest run.
+INDEX_THREAD_COUNT = 4
+INDEX_CHUNK_SIZE = 500
+
+PUBLICATION_UPDATE_FIELDS = (
+    "title",
+    "description",
+    "publisher",
+    "issued",
+    "resource_type",
+    "resource_format",
+    "rights",
+    "journal",
+    "oai_identifier",
+    "oai_datestamp",
+    "updated_at",
+)
+
+
+# Core columns are validated once per definition rather than per record.
+CORE_METADATA_FIELDS = PublicationSerializer.CORE_METADATA_FIELDS
+CORE_FIELD_MAX_LENGTHS = {
+    field: Publication._meta.get_field(field).max_length
+    for field in CORE_METADATA_FIELDS
+}
+METADATA_FIELD_MAX_LENGTHS = {
+    field: PublicationMetadata._meta.get_field(field).max_length
+    for field in ("schema", "element", "qualifier", "language")
+}
+OAI_IDENTIFIER_MAX_LENGTH = Publication._meta.get_field("oai_identifier").max_length
+
+
+def validate_oai_payload(payload: Dict[str, object]) -> Tuple[Dict[str, object], List[Dict[str, str]]]:
+    """Clean a harvester-built payload without DRF field machinery.
+
+    Payloads come from ``Command._build_publication_payload`` rather than user
+    input, so only the coercions ``PublicationSerializer`` would apply are
+    needed. Returns the publication field values and the metadata rows in the
+    order the serializer would store them. Raises ``ValueError`` for values the
+    model cannot store.
+    """
+    fields: Dict[str, object] = {}
+    core_rows: List[Dict[str, str]] = []
+    for field, spec in CORE_METADATA_FIELDS.items():
+        raw = payload.get(field)
+        if spec["type"] == "date":
+            value = parse_date(raw) if isinstance(raw, str) and raw else None
+            metadata_value = value.isoformat() if value else ""
+        else:
+            value = "" if raw is None else str(raw).strip()
+            max_length = CORE_FIELD_MAX_LENGTHS[field]
+            if max_length is not None and len(value) > max_length:
+                raise ValueError(
+                    f"{field} exceeds {max_length} characters.")
+            metadata_value = value
+        fields[field] = value
+        if metadata_value:
+            core_rows.append({
+                "schema": spec["schema"],
+                "element": spec["element"],
+                "qualifier": spec["qualifier"] or "",
+                "value": metadata_value,
+                "language": "",
+            })
+
+    if not fields["title"]:
+        raise ValueError("title is required.")
+
+    extra_rows: List[Dict[str, str]] = []
+    for item in payload.get("metadata") or []:  # type: ignore[union-attr]
+        schema = (item.get("schema") or "dc").strip().lower()
+        element = (item.get("element") or "").strip().lower()
+        value = (item.get("value") or "").strip()
+        if not schema or not element or not value:
+            continue
+        row = {
+            "schema": schema,
+            "element": element,
+            "qualifier": (item.get("qualifier") or "").strip().lower(),
+            "value": value,
+            "language": (item.get("language") or "").strip().lower(),
+        }
+        for field, max_length in METADATA_FIELD_MAX_LENGTHS.items():
+            if len(row[field]) > max_length:
+                raise ValueError(
+                    f"metadata {field} exceeds {max_length} characters.")
+        extra_rows.append(row)
+
+    return fields, core_rows + extra_rows
+
+
+# Records on a page usually share a handful of datestamps, and both helpers
+# are pure functions of their (immutable) argument.
+@lru_cache(maxsize=8192)
+def parse_oai_datestamp(value: str) -> Optional[datetime]:
+    dt = parse_datetime(value)
+    if dt is None:
+        parsed_date = parse_date(value)
+        if parsed_date is None:
+            return None
+        dt = datetime.combine(parsed_date, time.min)
+    if timezone.is_naive(dt):
+        dt = dt.replace(tzinfo=dt_timezone.utc)
+    else:
+        dt = dt.astimezone(dt_timezone.utc)
+    return dt.replace(microsecond=0)
+
+
+@lru_cache(maxsize=1024)
+def format_oai_datestamp(value: datetime) -> str:
+    if timezone.is_naive(value):
+        value = value.replace(tzinfo=dt_timezone.utc)
+    dt_utc = value.astimezone(dt_timezone.utc).replace(microsecond=0)
+    return dt_utc.isoformat().replace("+00:00", "Z")
+
 
 @dataclass
 class HarvestSummary:
@@ -57,72 +224,148 @@ class Command(BaseCommand):
             default=None,
             help="Maximum number of records to harvest (useful for testing).",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_HARVEST_WORKERS,
+            help="Number of journals to harvest concurrently.",
+        )
 
     def handle(self, *args, **options):
         slug = options.get("journal_slug")
         from_override = options.get("from_date")
         limit = options.get("limit")
+        workers = options.get("workers") or DEFAULT_HARVEST_WORKERS
+        self._output_lock = threading.Lock()
 
         if slug:
-            journals = Journal.objects.filter(slug=slug)
-            if not journals.exists():
-                raise CommandError(f"Journal '{slug}' was not found.")
+            queryset = Journal.objects.filter(slug=slug)
         else:
-            journals = Journal.objects.exclude(
+            queryset = Journal.objects.exclude(
                 oai_url__isnull=True).exclude(oai_url="")
 
-        if not journals.exists():
+        # Evaluate once; the harvest only needs a handful of columns.
+        journals = list(queryset.only(*HARVEST_JOURNAL_FIELDS))
+        if not journals:
+            if slug:
+                raise CommandError(f"Journal '{slug}' was not found.")
             raise CommandError(
                 "No journals with an OAI-PMH URL are available to harvest.")
 
-        total_created = 0
-        total_updated = 0
-        for journal in journals:
-            log_writer = HarvestLogWriter.start(
-                journal=journal, endpoint=journal.oai_url)
-            summary: Optional[HarvestSummary] = None
-            try:
-                summary = self._harvest_journal(journal, from_override, limit)
-            except HarvestExecutionError as exc:
-                failure_summary = exc.summary
-                log_writer.mark_failure(str(exc), failure_summary.harvested)
-                self.stderr.write(
-                    self.style.ERROR(
-                        f"{journal.name}: {exc}"
-                    )
-                )
-                continue
-            except Exception as exc:  # pylint: disable=broad-except
-                log_writer.mark_failure(str(exc))
-                logger.exception(
-                    "Unexpected error while harvesting journal %s", journal)
-                self.stderr.write(
-                    self.style.ERROR(
-                        f"{journal.name}: unexpected error during harvest: {exc}"
-                    )
-                )
-                continue
-            else:
-                log_writer.mark_success(summary.harvested)
-                total_created += summary.created
-                total_updated += summary.updated
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"{journal.name}: harvested {summary.created} new, {summary.updated} updated publications."
-                    )
-                )
-            finally:
-                if summary is not None:
-                    log_writer.ensure_closed(summary.harvested)
-                else:
-                    log_writer.ensure_closed()
+        # Restore whatever the index was configured with (None resets it to
+        # the Elasticsearch default when nothing, or a stale "-1", was set).
+        refresh_interval = self._get_index_refresh_interval()
+        self._set_index_refresh_interval(REFRESH_DISABLED)
+        try:
+            self._harvest_journals(journals, from_override, limit, workers)
+        finally:
+            self._set_index_refresh_interval(refresh_interval)
+            self._refresh_index()
 
-        self.stdout.write(
+    def _harvest_journals(
+        self,
+        journals: List[Journal],
+        from_override: Optional[str],
+        limit: Optional[int],
+        workers: int,
+    ) -> None:
+        totals = HarvestSummary()
+
+        if workers <= 1 or len(journals) <= 1:
+            summaries = (self._run_journal(journal, from_override, limit)
+                         for journal in journals)
+            for summary in summaries:
+                if summary is not None:
+                    totals.created += summary.created
+                    totals.updated += summary.updated
+        else:
+            # Each journal is dominated by waits on its remote OAI endpoint,
+            # so overlapping them in threads shortens multi-journal runs.
+            with ThreadPoolExecutor(max_workers=min(workers, len(journals))) as executor:
+                futures = [
+                    executor.submit(self._run_journal_in_thread,
+                                    journal, from_override, limit)
+                    for journal in journals
+                ]
+                for future in as_completed(futures):
+                    summary = future.result()
+                    if summary is not None:
+                        totals.created += summary.created
+                        totals.updated += summary.updated
+
+        self._write(
+            self.stdout,
             self.style.SUCCESS(
-                f"Harvest complete. {total_created} new and {total_updated} updated publications processed."
-            )
+                f"Harvest complete. {totals.created} new and {totals.updated} updated publications processed."
+            ),
         )
 
+    def _run_journal_in_thread(
+        self,
+        journal: Journal,
+        from_override: Optional[str],
+        limit: Optional[int],
+    ) -> Optional[HarvestSummary]:
+        try:
+            return self._run_journal(journal, from_override, limit)
+        finally:
+            # Worker threads open their own connections; release them here.
+            connection.close()
+
+    def _run_journal(
+        self,
+        journal: Journal,
+        from_override: Optional[str],
+        limit: Optional[int],
+    ) -> Optional[HarvestSummary]:
+        log_writer = HarvestLogWriter.start(
+            journal=journal, endpoint=journal.oai_url)
+        # Anything that escapes the handlers below (e.g. KeyboardInterrupt)
+        # leaves the run recorded as failed.
+        status = OAIHarvestLog.Status.FAILED
+        record_count = 0
+        error = ""
+        try:
+            summary = self._harvest_journal(journal, from_override, limit)
+        except HarvestExecutionError as exc:
+            error = str(exc)
+            if exc.summary is not None:
+                record_count = exc.summary.harvested
+            self._write(
+                self.stderr,
+                self.style.ERROR(
+                    f"{journal.name}: {exc}"
+                ),
+            )
+            return None
+        except Exception as exc:  # pylint: disable=broad-except
+            error = str(exc)
+            logger.exception(
+                "Unexpected error while harvesting journal %s", journal)
+            self._write(
+                self.stderr,
+                self.style.ERROR(
+                    f"{journal.name}: unexpected error during harvest: {exc}"
+                ),
+            )
+            return None
+        else:
+            status = OAIHarvestLog.Status.SUCCESS
+            record_count = summary.harvested
+            self._write(
+                self.stdout,
+                self.style.SUCCESS(
+                    f"{journal.name}: harvested {summary.created} new, {summary.updated} updated publications."
+                ),
+            )
+            return summary
+        finally:
+            log_writer.finalize(status, record_count, error)
+
+    def _write(self, stream, message: str) -> None:
+        with self._output_lock:
+            stream.write(message)
+
     def _harvest_journal(
         self,
         journal: Journal,
@@ -147,7 +390,6 @@ class Command(BaseCommand):
         updated = 0
         processed = 0
         latest_datestamp = journal.last_harvested_at
-        publication_ids: List[str] = []
         resumption_token: Optional[str] = None
         params = dict(base_params)
 
@@ -160,7 +402,7 @@ class Command(BaseCommand):
                     params = dict(base_params)
                 try:
                     xml_payload = self._fetch_oai_response(base_url, params)
-                except (HTTPError, URLError) as exc:
+                except OAIClientError as exc:
                     raise HarvestExecutionError(
                         f"Failed to harvest '{journal.name}': {exc}",
                         summary=HarvestSummary(
@@ -172,6 +414,13 @@ class Command(BaseCommand):
                 if not records and not resumption_token:
                     break
 
+                identifiers = [record["identifier"]
+                               for record in records if record.get("identifier")]
+                existing = Publication.objects.in_bulk(
+                    identifiers, field_name="oai_identifier")
+                staged: Dict[str, Tuple[Publication,
+                                        List[PublicationMetadata]]] = {}
+
                 for record in records:
                     if record_limit is not None and processed >= record_limit:
                         resumption_token = None
@@ -183,11 +432,16 @@ class Command(BaseCommand):
                             "Skipping record with missing identifier for journal %s", journal)
                         processed += 1
                         continue
+                    if len(identifier) > OAI_IDENTIFIER_MAX_LENGTH:
+                        logger.warning(
+                            "Skipping record with identifier longer than %d characters for journal %s",
+                            OAI_IDENTIFIER_MAX_LENGTH, journal)
+                        processed += 1
+                        continue
 
                     datestamp = self._parse_oai_datestamp(
                         record.get("datestamp"))
-                    publication = Publication.objects.filter(
-                        oai_identifier=identifier).first()
+                    publication = existing.get(identifier)
                     was_existing = publication is not None
                     if (
                         was_existing
@@ -204,35 +458,45 @@ class Command(BaseCommand):
                         continue
 
                     try:
-                        with transaction.atomic():
-                            serializer = PublicationSerializer(
-                                instance=publication, data=payload)
-                            serializer.is_valid(raise_exception=True)
-                            publication = serializer.save()
-                            update_fields = ["journal", "oai_datestamp"]
-                            publication.journal = journal
-                            publication.oai_datestamp = datestamp
-                            if identifier:
-                                publication.oai_identifier = identifier
-                                update_fields.append("oai_identifier")
-                            publication.save(update_fields=update_fields)
+                        fields, metadata_rows = validate_oai_payload(payload)
                     except Exception as exc:  # pylint: disable=broad-except
                         logger.exception(
-                            "Failed to persist OAI record %s: %s", identifier, exc)
+                            "Failed to validate OAI record %s: %s", identifier, exc)
                         processed += 1
                         continue
 
+                    if publication is None:
+                        publication = Publication()
+                    for attr, value in fields.items():
+                        setattr(publication, attr, value)
+                    publication.journal = journal
+                    publication.oai_datestamp = datestamp
+                    publication.oai_identifier = identifier
+                    entries = [
+                        PublicationMetadata(
+                            publication=publication, position=position, **row)
+                        for position, row in enumerate(metadata_rows)
+                    ]
+                    staged[identifier] = (publication, entries)
+                    existing[identifier] = publication
+                    processed += 1
+
+                # Only records the database accepted count towards the run.
+                stored = self._persist_publications(staged)
+                for publication, is_new in stored:
                     if publication.oai_datestamp and (
                         latest_datestamp is None or publication.oai_datestamp > latest_datestamp
                     ):
                         latest_datestamp = publication.oai_datestamp
-
-                    publication_ids.append(str(publication.pk))
-                    if was_existing:
-                        updated += 1
-                    else:
+                    if is_new:
                         created += 1
-                    processed += 1
+                    else:
+                        updated += 1
+                # Index page by page so the metadata query and the bulk
+                # request stay bounded by the OAI page size.
+                if stored:
+                    self._index_publications(
+                        [publication for publication, _ in stored])
 
                 if not resumption_token:
                     break
@@ -245,15 +509,121 @@ class Command(BaseCommand):
             ) from exc
 
         if latest_datestamp and latest_datestamp != journal.last_harvested_at:
+            Journal.objects.filter(pk=journal.pk).update(
+                last_harvested_at=latest_datestamp)
             journal.last_harvested_at = latest_datestamp
-            journal.save(update_fields=["last_harvested_at"])
-
-        if publication_ids:
-            queryset = Publication.objects.filter(pk__in=publication_ids)
-            PublicationDocument().update(queryset)
 
         return HarvestSummary(created=created, updated=updated)
 
+    def _persist_publications(
+        self,
+        staged: Dict[str, Tuple[Publication, List[PublicationMetadata]]],
+    ) -> List[Tuple[Publication, bool]]:
+        """Write one page of validated records using batched statements.
+
+        Returns the stored publications, each with whether it was created. If
+        the database rejects the batch (e.g. a value too long for its column),
+        the page is retried record by record so only the offending records
+        are skipped and logged.
+        """
+        rows = [
+            (identifier, publication, entries, publication._state.adding)
+            for identifier, (publication, entries) in staged.items()
+        ]
+        if not rows:
+            return []
+        try:
+            self._write_publications(rows)
+        except (DataError, IntegrityError) as exc:
+            logger.warning(
+                "Batched write of %d OAI records failed, retrying one by one: %s", len(rows), exc)
+        else:
+            return [(publication, is_new) for _, publication, _, is_new in rows]
+
+        persisted: List[Tuple[Publication, bool]] = []
+        for row in rows:
+            identifier, publication, _, is_new = row
+            try:
+                self._write_publications([row])
+            except (DataError, IntegrityError) as exc:
+                logger.exception(
+                    "Failed to persist OAI record %s: %s", identifier, exc)
+            else:
+                persisted.append((publication, is_new))
+        return persisted
+
+    def _write_publications(
+        self,
+        rows: List[Tuple[str, Publication, List[PublicationMetadata], bool]],
+    ) -> None:
+        to_create: List[Publication] = []
+        to_update: List[Publication] = []
+        metadata_entries: List[PublicationMetadata] = []
+        reserved_slugs: Set[str] = set()
+        now = timezone.now()
+        for _, publication, entries, is_new in rows:
+            # Undo anything a rolled-back attempt marked as saved.
+            publication._state.adding = is_new
+            for entry in entries:
+                entry.pk = None
+                entry._state.adding = True
+            if is_new:
+                publication.ensure_slug(reserved_slugs)
+                to_create.append(publication)
+            else:
+                publication.updated_at = now
+                to_update.append(publication)
+            metadata_entries.extend(entries)
+
+        with transaction.atomic():
+            if to_create:
+                Publication.objects.bulk_create(to_create)
+            if to_update:
+                Publication.objects.bulk_update(
+                    to_update, PUBLICATION_UPDATE_FIELDS)
+                # A raw DELETE: QuerySet.delete() would fetch the rows and
+                # send post_delete for each, making the search signal
+                # processor queue every publication for a second, serial
+                # re-index on top of _index_publications.
+                stale_metadata = PublicationMetadata.objects.filter(
+                    publication__in=to_update)
+                stale_metadata._raw_delete(stale_metadata.db)
+            if metadata_entries:
+                PublicationMetadata.bulk_create_normalized(metadata_entries)
+
+    def _index_publications(self, publications: List[Publication]) -> None:
+        # Index straight from the in-memory instances; one metadata query
+        # replaces re-fetching the rows through a fresh queryset.
+        attach_metadata_rows(publications)
+        PublicationDocument().update(
+            publications,
+            refresh=False,
+            parallel=True,
+            thread_count=INDEX_THREAD_COUNT,
+            chunk_size=INDEX_CHUNK_SIZE,
+        )
+
+    def _get_index_refresh_interval(self) -> Optional[str]:
+        try:
+            return get_refresh_interval(PublicationDocument._index)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(
+                "Could not read search index refresh interval: %s", exc)
+            return None
+
+    def _set_index_refresh_interval(self, interval: Optional[str]) -> None:
+        try:
+            set_refresh_interval(PublicationDocument._index, interval)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(
+                "Could not set search index refresh interval to %s: %s", interval, exc)
+
+    def _refresh_index(self) -> None:
+        try:
+            PublicationDocument._index.refresh()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Could not refresh search index: %s", exc)
+
     def _prepare_oai_endpoint(self, oai_url: str) -> Tuple[str, Dict[str, str]]:
         parsed = urlparse(oai_url)
         base_url = urlunparse(
@@ -262,52 +632,100 @@ class Command(BaseCommand):
                   values in parse_qs(parsed.query).items() if values}
         return base_url, params
 
-    def _fetch_oai_response(self, base_url: str, params: Dict[str, str]) -> str:
+    def _fetch_oai_response(self, base_url: str, params: Dict[str, str]) -> bytes:
         # Delegate to shared helper so API tests can reuse consistent behaviour.
         return fetch_oai_response(base_url, params, timeout=60)
 
-    def _parse_oai_records(self, xml_payload: str) -> Tuple[List[Dict[str, object]], Optional[str]]:
+    def _parse_oai_records(self, xml_payload: bytes) -> Tuple[List[Dict[str, object]], Optional[str]]:
+        if lxml_etree is not None:
+            return self._parse_oai_records_lxml(xml_payload)
+
+        # Stream the page so each <record> subtree is released once parsed
+        # instead of holding the whole document in memory.
+        records: List[Dict[str, object]] = []
+        resumption: Optional[str] = None
         try:
-            root = ET.fromstring(xml_payload)
+            for _, element in ET.iterparse(BytesIO(xml_payload), events=("end",)):
+                if element.tag == RECORD_TAG:
+                    record = self._parse_oai_record(element)
+                    if record is not None:
+                        records.append(record)
+                    element.clear()
+                elif element.tag == RESUMPTION_TOKEN_TAG:
+                    resumption = (element.text or "").strip() or None
         except ET.ParseError as exc:  # pragma: no cover - defensive
             raise CommandError(f"Could not parse OAI response: {exc}") from exc
+        return records, resumption
 
-        records: List[Dict[str, object]] = []
-        for record in root.findall(".//oai:record", OAI_NAMESPACES):
-            header = record.find("oai:header", OAI_NAMESPACES)
-            if header is None or header.get("status") == "deleted":
-                continue
+    def _parse_oai_records_lxml(self, xml_payload: bytes) -> Tuple[List[Dict[str, object]], Optional[str]]:
+        try:
+            root = lxml_etree.fromstring(xml_payload, parser=LXML_PARSER)
+        except lxml_etree.XMLSyntaxError as exc:  # pragma: no cover - defensive
+            raise CommandError(f"Could not parse OAI response: {exc}") from exc
 
-            metadata = record.find("oai:metadata", OAI_NAMESPACES)
-            if metadata is None:
+        records: List[Dict[str, object]] = []
+        for record in RECORD_XPATH(root):
+            headers = HEADER_XPATH(record)
+            if not headers or headers[0].get("status") == "deleted":
                 continue
 
-            dc_node = metadata.find("oai_dc:dc", OAI_NAMESPACES)
-            if dc_node is None:
+            dc_nodes = DC_NODE_XPATH(record)
+            if not dc_nodes:
                 continue
 
-            values: Dict[str, List[str]] = defaultdict(list)
-            for child in list(dc_node):
-                text = (child.text or "").strip()
+            values: Dict[str, List[str]] = {}
+            for child in CHILD_ELEMENTS_XPATH(dc_nodes[0]):
+                if not child.text:
+                    continue
+                text = child.text.strip()
                 if not text:
                     continue
-                local_name = child.tag.split("}")[-1].lower()
-                values[local_name].append(text)
-
-            records.append(
-                {
-                    "identifier": header.findtext("oai:identifier", default="", namespaces=OAI_NAMESPACES),
-                    "datestamp": header.findtext("oai:datestamp", default="", namespaces=OAI_NAMESPACES),
-                    "values": values,
-                }
-            )
+                values.setdefault(
+                    lxml_etree.QName(child).localname.lower(), []).append(text)
 
-        resumption = root.findtext(
-            ".//oai:resumptionToken", default="", namespaces=OAI_NAMESPACES) or None
-        if resumption:
-            resumption = resumption.strip() or None
+            header = headers[0]
+            records.append({
+                "identifier": IDENTIFIER_XPATH(header),
+                "datestamp": DATESTAMP_XPATH(header),
+                "values": values,
+            })
+
+        resumption = RESUMPTION_TOKEN_XPATH(root).strip() or None
         return records, resumption
 
+    def _parse_oai_record(self, record: ET.Element) -> Optional[Dict[str, object]]:
+        header = record.find(HEADER_TAG)
+        if header is None or header.get("status") == "deleted":
+            return None
+
+        metadata = record.find(METADATA_TAG)
+        if metadata is None:
+            return None
+
+        dc_node = metadata.find(DC_TAG)
+        if dc_node is None:
+            return None
+
+        values: Dict[str, List[str]] = {}
+        for child in dc_node:
+            if not child.text:
+                continue
+            text = child.text.strip()
+            if not text:
+                continue
+            tag = child.tag
+            if tag.startswith(DC_ELEMENT_PREFIX):
+                local_name = tag[DC_ELEMENT_PREFIX_LEN:].lower()
+            else:
+                local_name = tag.rpartition("}")[2].lower()
+            values.setdefault(local_name, []).append(text)
+
+        return {
+            "identifier": header.findtext(IDENTIFIER_TAG, default=""),
+            "datestamp": header.findtext(DATESTAMP_TAG, default=""),
+            "values": values,
+        }
+
     def _build_publication_payload(self, record: Dict[str, object]) -> Optional[Dict[str, object]]:
         values: Dict[str, List[str]] = record.get(
             "values", {})  # type: ignore[assignment]
@@ -326,38 +744,29 @@ class Command(BaseCommand):
         issued_str = self._first(values.get("date"))
         issued = self._parse_date_only(issued_str)
 
-        metadata_entries: List[Dict[str, object]] = []
-        position = 0
-
-        def extend_metadata(element: str, entries: Iterable[str]):
-            nonlocal position
-            for entry in entries:
-                cleaned = entry.strip()
-                if not cleaned:
-                    continue
-                metadata_entries.append(
-                    {
-                        "schema": "dc",
-                        "element": element,
-                        "qualifier": "",
-                        "value": cleaned,
-                        "language": "",
-                        "position": position,
-                    }
-                )
-                position += 1
-
-        extend_metadata("creator", values.get("creator", []))
-        extend_metadata("contributor", values.get("contributor", []))
-        extend_metadata("subject", values.get("subject", []))
-        extend_metadata("identifier", values.get("identifier", []))
-        extend_metadata("language", values.get("language", []))
-        extend_metadata("relation", values.get("relation", []))
-        extend_metadata("coverage", values.get("coverage", []))
-        extend_metadata("source", values.get("source", []))
-
-        additional_dates = values.get("date", [])[1:]
-        extend_metadata("date", additional_dates)
+        cleaned_entries = [
+            (element, cleaned)
+            for element in METADATA_ELEMENTS
+            for cleaned in (entry.strip() for entry in values.get(element, ()))
+            if cleaned
+        ]
+        # Only the first date populates ``issued``; the rest are kept as metadata.
+        cleaned_entries.extend(
+            ("date", cleaned)
+            for cleaned in (entry.strip() for entry in values.get("date", [])[1:])
+            if cleaned
+        )
+        metadata_entries: List[Dict[str, object]] = [
+            {
+                "schema": "dc",
+                "element": element,
+                "qualifier": "",
+                "value": value,
+                "language": "",
+                "position": position,
+            }
+            for position, (element, value) in enumerate(cleaned_entries)
+        ]
 
         payload: Dict[str, object] = {
             "title": title,
@@ -374,23 +783,10 @@ class Command(BaseCommand):
     def _parse_oai_datestamp(self, value: Optional[str]) -> Optional[datetime]:
         if not value:
             return None
-        dt = parse_datetime(value)
-        if dt is None:
-            parsed_date = parse_date(value)
-            if parsed_date is None:
-                return None
-            dt = datetime.combine(parsed_date, time.min)
-        if timezone.is_naive(dt):
-            dt = dt.replace(tzinfo=dt_timezone.utc)
-        else:
-            dt = dt.astimezone(dt_timezone.utc)
-        return dt.replace(microsecond=0)
+        return parse_oai_datestamp(value)
 
     def _format_oai_datestamp(self, value: datetime) -> str:
-        if timezone.is_naive(value):
-            value = value.replace(tzinfo=dt_timezone.utc)
-        dt_utc = value.astimezone(dt_timezone.utc).replace(microsecond=0)
-        return dt_utc.isoformat().replace("+00:00", "Z")
+        return format_oai_datestamp(value)
 
     def _parse_date_only(self, value: Optional[str]):
         if not value:
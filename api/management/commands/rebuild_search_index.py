@@ -0,0 +1,48 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from elasticsearch.exceptions import NotFoundError, TransportError
+
+from api.search.publication_index import PublicationDocument
+from api.search.refresh import REFRESH_DISABLED, get_refresh_interval, set_refresh_interval
+
+logger = logging.getLogger(__name__)
+
+INDEX_THREAD_COUNT = 4
+
+
+class Command(BaseCommand):
+    help = "Recreate the publications search index and bulk-load it with refreshes disabled."
+
+    def handle(self, *args, **options):
+        index = PublicationDocument._index
+        try:
+            try:
+                index.delete()
+            except NotFoundError:
+                pass
+            index.create()
+            # Refresh stays off only for the load; whatever the new index was
+            # created with is put back afterwards (None resets the default).
+            refresh_interval = get_refresh_interval(index)
+            set_refresh_interval(index, REFRESH_DISABLED)
+        except TransportError as exc:
+            raise CommandError(f"Could not recreate the search index: {exc}") from exc
+
+        document = PublicationDocument()
+        try:
+            document.update(
+                document.get_indexing_queryset(),
+                refresh=False,
+                parallel=True,
+                thread_count=INDEX_THREAD_COUNT,
+            )
+        finally:
+            try:
+                set_refresh_interval(index, refresh_interval)
+                index.refresh()
+            except TransportError as exc:
+                logger.warning("Could not restore search index refresh: %s", exc)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {document.get_queryset().count()} publications."))
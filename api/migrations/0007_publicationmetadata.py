@@ -1,57 +1,109 @@
-from django.db import migrations, models
+from itertools import islice
 
+from django.db import migrations, models, transaction
+from django.utils import timezone
 
-def forwards(apps, schema_editor):
-    Publication = apps.get_model("api", "Publication")
-    PublicationMetadata = apps.get_model("api", "PublicationMetadata")
 
-    field_map = (
-        ("creator", "creator", None),
-        ("subject", "subject", None),
-        ("contributor", "contributor", None),
-        ("identifier", "identifier", None),
-        ("source", "source", None),
-        ("language", "language", None),
-        ("relation", "relation", None),
-        ("coverage", "coverage", None),
-    )
+# (attribute, element, qualifier)
+LEGACY_FIELD_MAP = (
+    ("creator", "creator", ""),
+    ("subject", "subject", ""),
+    ("contributor", "contributor", ""),
+    ("identifier", "identifier", ""),
+    ("source", "source", ""),
+    ("language", "language", ""),
+    ("relation", "relation", ""),
+    ("coverage", "coverage", ""),
+)
+
 
-    batch = []
-    for publication in Publication.objects.all():
+METADATA_COLUMNS = (
+    "publication_id",
+    "schema",
+    "element",
+    "qualifier",
+    "value",
+    "language",
+    "position",
+    "created_at",
+    "updated_at",
+)
+
+
+def _generate_metadata(rows, prepare_publication_id, timestamp):
+    for row in rows:
+        publication_id = prepare_publication_id(row["id"])
         position = 0
-        for field_name, element, qualifier in field_map:
-            values = getattr(publication, field_name, None)
-            if values in (None, ""):
+        for field_name, element, qualifier in LEGACY_FIELD_MAP:
+            values = row[field_name]
+            if not values:
                 continue
             if isinstance(values, str):
-                values = [values]
-            for value in values:
-                if value in (None, ""):
-                    continue
-                if isinstance(value, str):
-                    normalized = value.strip()
-                else:
-                    normalized = str(value).strip()
-                if not normalized:
-                    continue
-                batch.append(
-                    PublicationMetadata(
-                        publication=publication,
-                        schema="dc",
-                        element=element,
-                        qualifier=qualifier or "",
-                        value=normalized,
-                        language="",
-                        position=position,
-                    )
-                )
-                position += 1
-        if len(batch) >= 500:
-            PublicationMetadata.objects.bulk_create(batch)
-            batch = []
-
-    if batch:
-        PublicationMetadata.objects.bulk_create(batch)
+                values = (values,)
+            normalized_values = [
+                normalized
+                for value in values
+                if value not in (None, "") and (normalized := str(value).strip())
+            ]
+            yield from (
+                (publication_id, "dc", element, qualifier,
+                 normalized, "", index, timestamp, timestamp)
+                for index, normalized in enumerate(normalized_values, start=position)
+            )
+            position += len(normalized_values)
+
+
+def _copy_legacy_fields(connection, Publication, PublicationMetadata):
+    # Rows are inserted with one parameterised statement through executemany,
+    # skipping model instantiation and the bulk_create pipeline. Values are
+    # prepared through the model fields so UUIDs and datetimes match what the
+    # ORM would send for this backend.
+    batch_size = 5000
+    quote_name = connection.ops.quote_name
+    sql = "INSERT INTO {table} ({columns}) VALUES ({placeholders})".format(
+        table=quote_name(PublicationMetadata._meta.db_table),
+        columns=", ".join(quote_name(column) for column in METADATA_COLUMNS),
+        placeholders=", ".join(["%s"] * len(METADATA_COLUMNS)),
+    )
+    publication_field = PublicationMetadata._meta.get_field("publication")
+    timestamp = PublicationMetadata._meta.get_field("created_at").get_db_prep_save(
+        timezone.now(), connection)
+
+    def prepare_publication_id(value):
+        return publication_field.get_db_prep_save(value, connection)
+
+    # Plain dicts avoid building a model instance per publication.
+    rows = Publication.objects.values(
+        "id", *(field_name for field_name, _, _ in LEGACY_FIELD_MAP)
+    ).iterator(chunk_size=2000)
+    entries = _generate_metadata(rows, prepare_publication_id, timestamp)
+    with connection.cursor() as cursor:
+        while True:
+            batch = list(islice(entries, batch_size))
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+
+
+def forwards(apps, schema_editor):
+    Publication = apps.get_model("api", "Publication")
+    PublicationMetadata = apps.get_model("api", "PublicationMetadata")
+    connection = schema_editor.connection
+
+    # Run the backfill as one transaction and skip per-row foreign key
+    # checks; every inserted row points at a publication that was just read.
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+            elif connection.vendor == "mysql":
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            _copy_legacy_fields(connection, Publication, PublicationMetadata)
+        finally:
+            if connection.vendor == "mysql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
 
 
 class Migration(migrations.Migration):
@@ -80,6 +132,9 @@ class Migration(migrations.Migration):
                 "ordering": ("position", "id"),
             },
         ),
+        # Backfill before building the composite indexes so the bulk insert
+        # does not pay B-tree maintenance on every row.
+        migrations.RunPython(forwards, migrations.RunPython.noop),
         migrations.AddIndex(
             model_name="publicationmetadata",
             index=models.Index(fields=("publication", "schema", "element",
@@ -90,7 +145,6 @@ class Migration(migrations.Migration):
             index=models.Index(fields=(
                 "schema", "element", "qualifier"), name="api_publica_schema_0125f0_idx"),
         ),
-        migrations.RunPython(forwards, migrations.RunPython.noop),
         migrations.RemoveField(model_name="publication", name="contributor"),
         migrations.RemoveField(model_name="publication", name="coverage"),
         migrations.RemoveField(model_name="publication", name="creator"),
@@ -1,83 +1,51 @@
-from django.db import migrations
+from django.db import migrations, transaction
+from django.db.models import Max
 
 
-def add_core_publication_metadata(apps, schema_editor):
-    Publication = apps.get_model("api", "Publication")
-    PublicationMetadata = apps.get_model("api", "PublicationMetadata")
-
+def _add_missing_core_fields(Publication, PublicationMetadata):
+    # (attribute, schema, element, qualifier, is_date); all keys are already
+    # lowercase so they can be compared against the existing-key set as is.
     field_specs = (
-        (
-            "title",
-            "dc",
-            "title",
-            "",
-            lambda publication: (
-                getattr(publication, "title", "") or "").strip(),
-        ),
-        (
-            "description",
-            "dc",
-            "description",
-            "",
-            lambda publication: (
-                getattr(publication, "description", "") or "").strip(),
-        ),
-        (
-            "publisher",
-            "dc",
-            "publisher",
-            "",
-            lambda publication: (
-                getattr(publication, "publisher", "") or "").strip(),
-        ),
-        (
-            "resource_type",
-            "dc",
-            "type",
-            "",
-            lambda publication: (
-                getattr(publication, "resource_type", "") or "").strip(),
-        ),
-        (
-            "resource_format",
-            "dc",
-            "format",
-            "",
-            lambda publication: (
-                getattr(publication, "resource_format", "") or "").strip(),
-        ),
-        (
-            "issued",
-            "dc",
-            "date",
-            "issued",
-            lambda publication: getattr(publication, "issued", None),
-        ),
-        (
-            "rights",
-            "dc",
-            "rights",
-            "",
-            lambda publication: (
-                getattr(publication, "rights", "") or "").strip(),
-        ),
+        ("title", "dc", "title", "", False),
+        ("description", "dc", "description", "", False),
+        ("publisher", "dc", "publisher", "", False),
+        ("resource_type", "dc", "type", "", False),
+        ("resource_format", "dc", "format", "", False),
+        ("issued", "dc", "date", "issued", True),
+        ("rights", "dc", "rights", "", False),
     )
 
     batch = []
-    batch_size = 500
+    # Flush in large chunks; insert_batch_size bounds each multi-row INSERT.
+    batch_size = 5000
+    insert_batch_size = 1000
+
+    # Load existing keys and per-publication positions up front instead of
+    # querying once per publication and field.
+    existing = {
+        (publication_id, schema.lower(), element.lower(), (qualifier or "").lower())
+        for publication_id, schema, element, qualifier in
+        PublicationMetadata.objects.values_list(
+            "publication_id", "schema", "element", "qualifier")
+    }
+    max_positions = dict(
+        PublicationMetadata.objects.values("publication_id")
+        .annotate(max_position=Max("position"))
+        .values_list("publication_id", "max_position")
+    )
 
-    for publication in Publication.objects.all().iterator():
-        existing_count = PublicationMetadata.objects.filter(
-            publication=publication
-        ).count()
-        position = existing_count
+    publications = Publication.objects.only(
+        "id", *(attr_name for attr_name, *_ in field_specs)
+    ).iterator(chunk_size=2000)
+    for publication in publications:
+        position = max_positions.get(publication.pk, -1) + 1
 
-        for attr_name, schema, element, qualifier, extractor in field_specs:
-            raw_value = extractor(publication)
+        for attr_name, schema, element, qualifier, is_date in field_specs:
+            raw_value = getattr(publication, attr_name)
             if raw_value in (None, ""):
                 continue
 
-            if schema == "dc" and element == "date" and qualifier == "issued":
+            if is_date:
                 value = raw_value.isoformat() if hasattr(
                     raw_value, "isoformat") else str(raw_value)
             else:
@@ -86,13 +54,7 @@ def add_core_publication_metadata(apps, schema_editor):
             if not value:
                 continue
 
-            exists = PublicationMetadata.objects.filter(
-                publication=publication,
-                schema__iexact=schema,
-                element__iexact=element,
-                qualifier__iexact=(qualifier or ""),
-            ).exists()
-            if exists:
+            if (publication.pk, schema, element, qualifier) in existing:
                 continue
 
             batch.append(
@@ -100,7 +62,7 @@ def add_core_publication_metadata(apps, schema_editor):
                     publication=publication,
                     schema=schema,
                     element=element,
-                    qualifier=qualifier or "",
+                    qualifier=qualifier,
                     value=value,
                     language="",
                     position=position,
@@ -109,11 +71,34 @@ def add_core_publication_metadata(apps, schema_editor):
             position += 1
 
             if len(batch) >= batch_size:
-                PublicationMetadata.objects.bulk_create(batch)
+                PublicationMetadata.objects.bulk_create(
+                    batch, batch_size=insert_batch_size)
                 batch = []
 
     if batch:
-        PublicationMetadata.objects.bulk_create(batch)
+        PublicationMetadata.objects.bulk_create(
+            batch, batch_size=insert_batch_size)
+
+
+def add_core_publication_metadata(apps, schema_editor):
+    Publication = apps.get_model("api", "Publication")
+    PublicationMetadata = apps.get_model("api", "PublicationMetadata")
+    connection = schema_editor.connection
+
+    # Run the backfill as one transaction and skip per-row foreign key
+    # checks; every inserted row points at a publication that was just read.
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+            elif connection.vendor == "mysql":
+                cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            _add_missing_core_fields(Publication, PublicationMetadata)
+        finally:
+            if connection.vendor == "mysql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
 
 
 class Migration(migrations.Migration):
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_oaiharvestlog"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="publication",
+            name="title",
+            field=models.CharField(db_index=True, max_length=512),
+        ),
+    ]
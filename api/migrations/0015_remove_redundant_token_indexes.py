@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0014_publication_title_index"),
+    ]
+
+    operations = [
+        # Both token columns are unique and therefore already indexed.
+        migrations.RemoveIndex(
+            model_name="usertoken",
+            name="api_usertok_token_e30abd_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="researcherinstitutionalemailtoken",
+            name="api_research_token_9abf4f_idx",
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0015_remove_redundant_token_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="usertoken",
+            index=models.Index(fields=("user", "token_type", "is_used"),
+                               name="api_usertok_user_id_de1bf9_idx"),
+        ),
+    ]
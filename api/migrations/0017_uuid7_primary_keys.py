@@ -0,0 +1,37 @@
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0016_usertoken_user_type_used_index"),
+    ]
+
+    # Only the default changes; existing rows keep their version 4 ids.
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="id",
+            field=models.UUIDField(default=api.models.uuid7, editable=False,
+                                   primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name="journal",
+            name="id",
+            field=models.UUIDField(default=api.models.uuid7, editable=False,
+                                   primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name="publication",
+            name="id",
+            field=models.UUIDField(default=api.models.uuid7, editable=False,
+                                   primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name="researcherprofile",
+            name="id",
+            field=models.UUIDField(default=api.models.uuid7, editable=False,
+                                   primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0017_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="researcherexperience",
+            index=models.Index(fields=("profile", "-is_current", "-start_date", "-end_date"),
+                               name="api_researc_profile_30f12a_idx"),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0018_researcherexperience_profile_ordering_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="oaiharvestlog",
+            index=models.Index(fields=("journal", "-started_at"),
+                               name="api_oaiharv_journal_ba1f62_idx"),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0019_oaiharvestlog_journal_started_index"),
+    ]
+
+    operations = [
+        # Issued tokens are secrets.token_urlsafe(48): exactly 64 characters.
+        migrations.AlterField(
+            model_name="usertoken",
+            name="token",
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="researcherinstitutionalemailtoken",
+            name="token",
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+    ]
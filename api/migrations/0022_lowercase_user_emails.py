@@ -0,0 +1,50 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+
+def lowercase_user_emails(apps, schema_editor):
+    User = apps.get_model("api", "User")
+    users = list(User.objects.only("id", "email"))
+
+    # Accounts whose addresses differ only by case cannot all be lowercased
+    # without violating the unique index, and picking one to keep is not
+    # something a migration should decide. On MySQL's default *_ci collation
+    # the unique index already compares case-insensitively, so such rows
+    # cannot exist there; this only triggers on case-sensitive backends.
+    by_normalized = defaultdict(list)
+    for user in users:
+        by_normalized[user.email.strip().lower()].append(user.email)
+    collisions = {
+        normalized: emails
+        for normalized, emails in by_normalized.items()
+        if len(emails) > 1
+    }
+    if collisions:
+        listed = "; ".join(
+            ", ".join(sorted(emails)) for _, emails in sorted(collisions.items()))
+        raise RuntimeError(
+            "Cannot lowercase user emails: these accounts differ only by case "
+            f"and must be merged or renamed first: {listed}"
+        )
+
+    # Rows needing a rewrite are found in Python because under a *_ci
+    # collation "A@x" = LOWER("A@x") is true, so SQL cannot select them.
+    batch = []
+    for user in users:
+        normalized = user.email.strip().lower()
+        if normalized != user.email:
+            user.email = normalized
+            batch.append(user)
+    User.objects.bulk_update(batch, ["email"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0021_shrink_token_columns"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_user_emails, migrations.RunPython.noop),
+    ]
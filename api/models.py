@@ -1,18 +1,77 @@
 from __future__ import annotations
 
+import re
 import secrets
+import time
 import uuid
+from collections import defaultdict
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 
 
+def _unique_slug(queryset, first: str, prefix: str, reserved: set[str] | None = None) -> str:
+    """Return ``first`` or the first free ``{prefix}-{n}`` slug (n >= 2).
+
+    Taken candidates are fetched in one query rather than probed with an
+    EXISTS query per counter value. ``istartswith`` compiles to a plain
+    ``LIKE 'prefix-%'`` on MySQL, which range-scans the unique slug index
+    (``startswith`` becomes ``LIKE BINARY``, which bypasses the column
+    collation and so the index). The regex keeps the match exact, and
+    slugify() output is already lowercase.
+    """
+    taken = set(
+        queryset.filter(
+            models.Q(slug=first)
+            | models.Q(
+                slug__istartswith=f"{prefix}-",
+                slug__regex=rf"^{re.escape(prefix)}-[0-9]+$",
+            )
+        ).values_list("slug", flat=True)
+    )
+    slug = first
+    counter = 1
+    while slug in taken or (reserved is not None and slug in reserved):
+        counter += 1
+        slug = f"{prefix}-{counter}"
+    return slug
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered (RFC 9562 version 7) UUID.
+
+    Primary keys then grow roughly monotonically, so inserts append to the
+    index instead of landing on random B-tree pages.
+    """
+    if hasattr(uuid, "uuid7"):  # Python 3.14+
+        return uuid.uuid7()
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(secrets.token_bytes(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # variant
+    return uuid.UUID(int=value)
+
+
 class UserManager(BaseUserManager):
+    @classmethod
+    def normalize_email(cls, email: str | None) -> str:
+        # Emails are stored lowercased so lookups can use plain equality on
+        # the unique index instead of a case-insensitive match.
+        return (email or "").strip().lower()
+
+    def get_by_natural_key(self, username: str):
+        # This is the lookup ModelBackend authenticates with (including the
+        # JWT token endpoint), so load only what a login reads; saving
+        # last_login afterwards uses update_fields and needs nothing else.
+        return self.only(*self.model.AUTHENTICATION_FIELDS).get(
+            **{self.model.USERNAME_FIELD: self.normalize_email(username)})
+
     def create_user(self, email: str, password: str | None = None, **extra_fields):
         if not email:
             raise ValueError("Users must have an email address")
@@ -42,7 +101,7 @@ class UserManager(BaseUserManager):
 
 
 class User(AbstractBaseUser, PermissionsMixin):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=150, blank=True)
     last_name = models.CharField(max_length=150, blank=True)
@@ -55,6 +114,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     EMAIL_FIELD = "email"
     REQUIRED_FIELDS: list[str] = []
+    # Columns read when a user signs in (the admin login also checks is_staff).
+    AUTHENTICATION_FIELDS = ("email", "password", "is_active", "is_verified", "is_staff")
 
     objects = UserManager()
 
@@ -64,6 +125,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self) -> str:
         return self.email
 
+    def clean(self):
+        super().clean()
+        self.email = self.__class__.objects.normalize_email(self.email)
+
 
 class UserToken(models.Model):
     REGISTRATION = "registration"
@@ -80,14 +145,17 @@ class UserToken(models.Model):
 
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              on_delete=models.CASCADE, related_name="tokens")
-    token = models.CharField(max_length=128, unique=True, editable=False)
+    # token_urlsafe(48) always yields 64 characters.
+    token = models.CharField(max_length=64, unique=True, editable=False)
     token_type = models.CharField(max_length=32, choices=TOKEN_TYPE_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
 
     class Meta:
-        indexes = [models.Index(fields=("token", "token_type"))]
+        # ``token`` is unique, so its own index already serves every lookup.
+        # ``issue`` retires a user's outstanding tokens of one type.
+        indexes = [models.Index(fields=("user", "token_type", "is_used"))]
         ordering = ("-created_at",)
 
     def __str__(self) -> str:
@@ -95,11 +163,12 @@ class UserToken(models.Model):
 
     @classmethod
     def issue(cls, user: "User", token_type: str, ttl_hours: int) -> "UserToken":
-        cls.objects.filter(user=user, token_type=token_type,
-                           is_used=False).update(is_used=True)
         expires_at = timezone.now() + timedelta(hours=ttl_hours)
         token = secrets.token_urlsafe(48)
-        return cls.objects.create(user=user, token=token, token_type=token_type, expires_at=expires_at)
+        with transaction.atomic():
+            cls.objects.filter(user=user, token_type=token_type,
+                               is_used=False).update(is_used=True)
+            return cls.objects.create(user=user, token=token, token_type=token_type, expires_at=expires_at)
 
     def mark_used(self) -> None:
         self.is_used = True
@@ -110,7 +179,7 @@ class UserToken(models.Model):
 
 
 class Journal(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=255, unique=True)
     slug = models.SlugField(max_length=255, unique=True, editable=False)
     description = models.TextField(blank=True)
@@ -140,12 +209,8 @@ class Journal(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Journal.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                counter += 1
-                slug = f"{base_slug}-{counter}"
-            self.slug = slug
+            self.slug = _unique_slug(
+                Journal.objects.exclude(pk=self.pk), base_slug, base_slug)
         super().save(*args, **kwargs)
 
 
@@ -174,6 +239,7 @@ class OAIHarvestLog(models.Model):
 
     class Meta:
         ordering = ("-started_at", "-id")
+        indexes = [models.Index(fields=("journal", "-started_at"))]
         verbose_name = "OAI harvest log"
         verbose_name_plural = "OAI harvest logs"
 
@@ -196,13 +262,17 @@ class OAIHarvestLog(models.Model):
             "finished_at",
         ])
 
-    def mark_failure(self, reason: str, record_count: int = 0) -> None:
+    @staticmethod
+    def truncate_reason(reason: str) -> str:
         truncated_reason = (reason or "").strip()
         if truncated_reason and len(truncated_reason) > 2000:
             truncated_reason = f"{truncated_reason[:1997]}..."
+        return truncated_reason
+
+    def mark_failure(self, reason: str, record_count: int = 0) -> None:
         self.status = self.Status.FAILED
         self.record_count = max(0, record_count)
-        self.error_message = truncated_reason
+        self.error_message = self.truncate_reason(reason)
         self.finished_at = timezone.now()
         self.save(update_fields=[
             "status",
@@ -213,7 +283,7 @@ class OAIHarvestLog(models.Model):
 
 
 class Publication(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     journal = models.ForeignKey(
         Journal,
         related_name="publications",
@@ -221,7 +291,8 @@ class Publication(models.Model):
         blank=True,
         on_delete=models.SET_NULL,
     )
-    title = models.CharField(max_length=512)
+    # Indexed because both Publication and ResearcherPublication order by it.
+    title = models.CharField(max_length=512, db_index=True)
     slug = models.SlugField(max_length=512, unique=True, editable=False)
     description = models.TextField(blank=True)
     publisher = models.CharField(max_length=255, blank=True)
@@ -248,45 +319,69 @@ class Publication(models.Model):
         return self.title
 
     def save(self, *args, **kwargs):
+        self.ensure_slug()
+        super().save(*args, **kwargs)
+
+    def ensure_slug(self, reserved: set[str] | None = None) -> str:
+        """Assign a unique slug if missing.
+
+        ``reserved`` holds slugs claimed by unsaved instances in the same
+        batch (used by bulk_create paths, which bypass ``save``).
+        """
         if not self.slug:
             base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            while Publication.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                counter += 1
-                slug = f"{base_slug}-{counter}"
-            self.slug = slug
-        super().save(*args, **kwargs)
+            self.slug = _unique_slug(
+                Publication.objects.exclude(pk=self.pk), base_slug, base_slug, reserved)
+        if reserved is not None:
+            reserved.add(self.slug)
+        return self.slug
 
     def metadata_values(self, element: str, qualifier: str | None = None, schema: str = "dc") -> list[str]:
-        entries = self.metadata_entries.filter(
-            schema__iexact=schema,
-            element__iexact=element,
-        )
+        # Stored keys are normalised to lowercase, so exact matches suffice.
+        schema = schema.lower()
+        element = element.lower()
         if qualifier is not None:
-            entries = entries.filter(qualifier__iexact=qualifier)
+            qualifier = qualifier.lower()
+        if "metadata_entries" in getattr(self, "_prefetched_objects_cache", {}):
+            # Reuse prefetched rows rather than issuing another query.
+            entries = sorted(
+                (
+                    entry for entry in self.metadata_entries.all()
+                    if entry.schema == schema
+                    and entry.element == element
+                    and (qualifier is None or entry.qualifier == qualifier)
+                ),
+                key=lambda entry: (entry.position, entry.id),
+            )
+            raw_values = [entry.value for entry in entries]
+        else:
+            # Only the values are needed, so skip model instantiation.
+            queryset = self.metadata_entries.filter(schema=schema, element=element)
+            if qualifier is not None:
+                queryset = queryset.filter(qualifier=qualifier)
+            raw_values = queryset.order_by("position", "id").values_list("value", flat=True)
         values: list[str] = []
-        for entry in entries.order_by("position", "id"):
-            value = (entry.value or "").strip()
+        for raw_value in raw_values:
+            value = (raw_value or "").strip()
             if value:
                 values.append(value)
         return values
 
     def metadata_dict(self, schema: str | None = None) -> dict[str, list[str]]:
-        result: dict[str, list[str]] = {}
-        entries = self.metadata_entries.all()
-        if schema:
-            entries = entries.filter(schema__iexact=schema)
-        for entry in entries.order_by("schema", "element", "qualifier", "position", "id"):
-            key_parts = [entry.schema.lower(), entry.element.lower()]
-            if entry.qualifier:
-                key_parts.append(entry.qualifier.lower())
-            key = ".".join(key_parts)
-            value = (entry.value or "").strip()
-            if not value:
+        # Stored keys are already lowercase: save() and bulk_create_normalized
+        # both normalise them.
+        grouped: defaultdict[tuple[str, str, str], list[str]] = defaultdict(list)
+        schema = schema.lower() if schema else None
+        for entry in sorted(self.metadata_entries.all(), key=lambda entry: (entry.position, entry.id)):
+            if schema and entry.schema != schema:
                 continue
-            result.setdefault(key, []).append(value)
-        return result
+            value = (entry.value or "").strip()
+            if value:
+                grouped[(entry.schema, entry.element, entry.qualifier)].append(value)
+        return {
+            f"{key[0]}.{key[1]}.{key[2]}" if key[2] else f"{key[0]}.{key[1]}": grouped[key]
+            for key in sorted(grouped)
+        }
 
 
 class PublicationMetadata(models.Model):
@@ -318,16 +413,27 @@ class PublicationMetadata(models.Model):
         language = f" ({self.language})" if self.language else ""
         return f"{self.schema}.{self.element}{qualifier}: {self.value}{language}"
 
-    def save(self, *args, **kwargs):
+    def normalize(self) -> None:
         self.schema = (self.schema or "dc").strip().lower()
         self.element = (self.element or "").strip().lower()
         self.qualifier = (self.qualifier or "").strip().lower()
         self.language = (self.language or "").strip().lower()
+
+    def save(self, *args, **kwargs):
+        self.normalize()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_create_normalized(cls, entries, batch_size: int = 1000) -> list["PublicationMetadata"]:
+        """``bulk_create`` with the normalisation ``save()`` would have applied."""
+        entries = list(entries)
+        for entry in entries:
+            entry.normalize()
+        return cls.objects.bulk_create(entries, batch_size=batch_size)
+
 
 class ResearcherProfile(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -376,12 +482,11 @@ class ResearcherProfile(models.Model):
             self.display_name = synthesized or self.user.email.split("@")[0]
         if not self.slug:
             base_slug = slugify(self.display_name)
-            slug = base_slug or slugify(self.user.email.split("@")[0])
-            counter = 1
-            while ResearcherProfile.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                counter += 1
-                slug = f"{base_slug}-{counter}" if base_slug else f"researcher-{counter}"
-            self.slug = slug
+            self.slug = _unique_slug(
+                ResearcherProfile.objects.exclude(pk=self.pk),
+                base_slug or slugify(self.user.email.split("@")[0]),
+                base_slug or "researcher",
+            )
         super().save(*args, **kwargs)
 
     def mark_institutional_email_verified(self) -> None:
@@ -408,9 +513,9 @@ class ResearcherProfile(models.Model):
             profile=self,
             email=self.institutional_email,
         )
-        from .utils import send_institutional_email_verification
+        from .utils import queue_institutional_email_verification
 
-        send_institutional_email_verification(self, token)
+        queue_institutional_email_verification(self, token)
         return token
 
 
@@ -437,6 +542,11 @@ class ResearcherExperience(models.Model):
             "-end_date",
             "-id",
         )
+        # Matches "experiences for a profile" in the default ordering.
+        indexes = [
+            models.Index(fields=("profile", "-is_current",
+                         "-start_date", "-end_date")),
+        ]
         verbose_name = "Researcher experience"
         verbose_name_plural = "Researcher experiences"
 
@@ -478,7 +588,8 @@ class ResearcherInstitutionalEmailToken(models.Model):
         on_delete=models.CASCADE,
     )
     email = models.EmailField()
-    token = models.CharField(max_length=128, unique=True, editable=False)
+    # token_urlsafe(48) always yields 64 characters.
+    token = models.CharField(max_length=64, unique=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     is_used = models.BooleanField(default=False)
@@ -486,7 +597,6 @@ class ResearcherInstitutionalEmailToken(models.Model):
     class Meta:
         ordering = ("-created_at",)
         indexes = [
-            models.Index(fields=("token",)),
             models.Index(fields=("profile", "is_used")),
         ]
 
@@ -501,15 +611,16 @@ class ResearcherInstitutionalEmailToken(models.Model):
         *,
         ttl_hours: int = 48,
     ) -> "ResearcherInstitutionalEmailToken":
-        cls.objects.filter(profile=profile, is_used=False).update(is_used=True)
         token = secrets.token_urlsafe(48)
         expires_at = timezone.now() + timedelta(hours=ttl_hours)
-        return cls.objects.create(
-            profile=profile,
-            email=email,
-            token=token,
-            expires_at=expires_at,
-        )
+        with transaction.atomic():
+            cls.objects.filter(profile=profile, is_used=False).update(is_used=True)
+            return cls.objects.create(
+                profile=profile,
+                email=email,
+                token=token,
+                expires_at=expires_at,
+            )
 
     def mark_used(self) -> None:
         self.is_used = True
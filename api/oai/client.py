@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import gzip
+import threading
+import zlib
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 from urllib.error import HTTPError, URLError
@@ -9,6 +12,18 @@ from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 from urllib.request import Request, urlopen
 from xml.etree import ElementTree as ET
 
+try:
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+except ImportError:  # pragma: no cover - requests optional
+    requests = None  # type: ignore[assignment]
+
+try:
+    from lxml import etree as lxml_etree  # type: ignore
+except ImportError:  # pragma: no cover - lxml optional
+    lxml_etree = None
+
 OAI_NAMESPACES = {
     "oai": "http://www.openarchives.org/OAI/2.0/",
     "oai_dc": "http://www.openarchives.org/OAI/2.0/oai_dc/",
@@ -16,6 +31,25 @@ OAI_NAMESPACES = {
 }
 
 
+REQUEST_HEADERS = {
+    "User-Agent": "journals-harvester/1.0",
+    "Accept-Encoding": "gzip, deflate",
+}
+if lxml_etree is not None:
+    LXML_PARSER = lxml_etree.XMLParser(
+        resolve_entities=False, no_network=True, remove_comments=True)
+    # Compiled once at import; validate_oai_endpoint reuses them per call.
+    OAI_ERROR_XPATH = lxml_etree.XPath("//oai:error", namespaces=OAI_NAMESPACES)
+    OAI_IDENTIFY_XPATH = lxml_etree.XPath("//oai:Identify", namespaces=OAI_NAMESPACES)
+    OAI_REPOSITORY_NAME_XPATH = lxml_etree.XPath(
+        "string(oai:repositoryName)", namespaces=OAI_NAMESPACES)
+    XML_PARSE_ERRORS: Tuple[type, ...] = (ET.ParseError, lxml_etree.XMLSyntaxError)
+else:
+    XML_PARSE_ERRORS = (ET.ParseError,)
+# Sessions are kept per thread so concurrent harvests never share one.
+_session_state = threading.local()
+
+
 class OAIClientError(Exception):
     """Raised when the remote OAI endpoint cannot be reached."""
 
@@ -40,20 +74,78 @@ def prepare_oai_endpoint(oai_url: str) -> Tuple[str, Dict[str, str]]:
     return base_url, params
 
 
-def fetch_oai_response(base_url: str, params: Dict[str, str], *, timeout: int = 30) -> str:
+def _get_session() -> "requests.Session":
+    """Return this thread's pooled session, creating it on first use."""
+    session = getattr(_session_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(REQUEST_HEADERS)
+        # OAI-PMH servers signal flow control with 503 + Retry-After.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=4, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session_state.session = session
+    return session
+
+
+def _decode_body(payload: bytes, encoding: str) -> bytes:
+    """Undo the transfer compression urllib leaves in place (requests does this itself)."""
+    encoding = encoding.strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(payload)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(payload)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib header.
+            return zlib.decompress(payload, -zlib.MAX_WBITS)
+    return payload
+
+
+def fetch_oai_response(base_url: str, params: Dict[str, str], *, timeout: int = 30) -> bytes:
+    """Return the raw response body; the XML parser handles decoding."""
+    if requests is not None:
+        try:
+            response = _get_session().get(base_url, params=params, timeout=timeout)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise OAIClientError(str(exc)) from exc
+        return response.content
+
     query = urlencode(params)
     target = f"{base_url}?{query}" if query else base_url
-    request = Request(target, headers={"User-Agent": "journals-harvester/1.0"})
+    request = Request(target, headers=REQUEST_HEADERS)
     try:
         with urlopen(request, timeout=timeout) as response:  # nosec: B310 - controlled input
-            charset = response.headers.get_content_charset() or "utf-8"
-            return response.read().decode(charset, errors="ignore")
+            return _decode_body(response.read(), response.headers.get("Content-Encoding", ""))
     except (HTTPError, URLError) as exc:
         raise OAIClientError(str(exc)) from exc
 
 
-def _detect_oai_error(root: ET.Element) -> Optional[str]:
-    error_node = root.find(".//oai:error", namespaces=OAI_NAMESPACES)
+def _parse_oai_xml(payload: bytes):
+    """Parse an OAI payload with lxml when installed, ElementTree otherwise.
+
+    Lookups below use the compiled XPaths on lxml trees and ``find`` on
+    ElementTree ones; callers should catch ``XML_PARSE_ERRORS``.
+    """
+    if lxml_etree is not None:
+        return lxml_etree.fromstring(payload, parser=LXML_PARSER)
+    return ET.fromstring(payload)
+
+
+def _detect_oai_error(root) -> Optional[str]:
+    if lxml_etree is not None:
+        matches = OAI_ERROR_XPATH(root)
+        error_node = matches[0] if matches else None
+    else:
+        error_node = root.find(".//oai:error", namespaces=OAI_NAMESPACES)
     if error_node is None:
         return None
     code = error_node.get("code", "")
@@ -75,20 +167,27 @@ def validate_oai_endpoint(oai_url: str) -> OAIValidationResult:
         return OAIValidationResult(ok=False, message=f"Could not reach endpoint: {exc}")
 
     try:
-        root = ET.fromstring(payload)
-    except ET.ParseError as exc:
+        root = _parse_oai_xml(payload)
+    except XML_PARSE_ERRORS as exc:
         return OAIValidationResult(ok=False, message=f"Response was not valid XML: {exc}")
 
     error_message = _detect_oai_error(root)
     if error_message:
         return OAIValidationResult(ok=False, message=error_message)
 
-    identify = root.find(".//oai:Identify", namespaces=OAI_NAMESPACES)
+    if lxml_etree is not None:
+        matches = OAI_IDENTIFY_XPATH(root)
+        identify = matches[0] if matches else None
+    else:
+        identify = root.find(".//oai:Identify", namespaces=OAI_NAMESPACES)
     if identify is None:
         return OAIValidationResult(ok=False, message="The endpoint did not return an Identify response.")
 
-    repository_name = identify.findtext(
-        "oai:repositoryName", namespaces=OAI_NAMESPACES)
+    if lxml_etree is not None:
+        repository_name = OAI_REPOSITORY_NAME_XPATH(identify).strip()
+    else:
+        repository_name = identify.findtext(
+            "oai:repositoryName", namespaces=OAI_NAMESPACES)
     if repository_name:
         return OAIValidationResult(ok=True, message=f"Connected to '{repository_name}'.")
 
@@ -1,8 +1,50 @@
+from collections import defaultdict
+from itertools import islice
+from typing import Iterable
+from uuid import UUID
+
 from django_elasticsearch_dsl import Document, fields
 from django_elasticsearch_dsl.registries import registry
-from elasticsearch_dsl import analyzer
+from elasticsearch_dsl import Text, analyzer
+
+from ..models import Publication, PublicationMetadata
+
+# Metadata columns the document is built from, in the order they appear in
+# each row tuple.
+METADATA_ROW_FIELDS = ("schema", "element", "qualifier", "value", "language", "position")
+
+# Publication columns the document is built from. Metadata rows are not
+# covered here: their own saves and deletes queue the publication directly.
+INDEXED_MODEL_FIELDS = frozenset({
+    "title", "description", "publisher", "resource_type", "resource_format",
+    "rights", "slug", "issued", "created_at", "updated_at", "journal",
+})
+
+
+def _metadata_rows(publication_ids: Iterable[UUID]) -> defaultdict[UUID, list[tuple]]:
+    """Fetch indexed metadata as plain tuples, grouped by publication id."""
+    grouped: defaultdict[UUID, list[tuple]] = defaultdict(list)
+    rows = (
+        PublicationMetadata.objects
+        .filter(publication_id__in=publication_ids)
+        .order_by("position", "id")
+        .values_list("publication_id", *METADATA_ROW_FIELDS)
+    )
+    for publication_id, *row in rows:
+        grouped[publication_id].append(tuple(row))
+    return grouped
+
 
-from ..models import Publication
+def attach_metadata_rows(publications: Iterable[Publication]) -> None:
+    """Load metadata for a batch of publications in one query, ahead of indexing.
+
+    Rows are kept as tuples rather than ``PublicationMetadata`` instances and
+    are consumed by the first ``prepare()`` of each publication.
+    """
+    publications = list(publications)
+    grouped = _metadata_rows([publication.pk for publication in publications])
+    for publication in publications:
+        publication._metadata_rows = grouped.get(publication.pk, [])
 
 # Define the analyzer explicitly using elasticsearch_dsl
 standard_text_analyzer = analyzer(
@@ -11,6 +53,15 @@ standard_text_analyzer = analyzer(
     stopwords='_none_'
 )
 
+def _metadata_preparer(element: str):
+    """Build a ``prepare_<element>`` hook reading the bucket ``prepare()`` fills."""
+    def prepare_element(self, instance: Publication):
+        return instance._md_cache.get(element, [])
+
+    prepare_element.__name__ = f"prepare_{element}"
+    return prepare_element
+
+
 @registry.register_document
 class PublicationDocument(Document):
     title = fields.TextField(analyzer=standard_text_analyzer)
@@ -24,10 +75,7 @@ class PublicationDocument(Document):
     created_at = fields.DateField()
     updated_at = fields.DateField()
     journal_slug = fields.KeywordField()
-    journal_name = fields.TextField(
-        analyzer=standard_text_analyzer,
-        fields={"raw": fields.KeywordField()}
-    )
+    journal_name = fields.TextField(analyzer=standard_text_analyzer)
 
     creator = fields.TextField(
         analyzer=standard_text_analyzer,
@@ -45,13 +93,18 @@ class PublicationDocument(Document):
     language = fields.KeywordField(multi=True)
     relation = fields.TextField(analyzer=standard_text_analyzer, multi=True)
     coverage = fields.TextField(analyzer=standard_text_analyzer, multi=True)
-    metadata_text = fields.TextField(analyzer=standard_text_analyzer, multi=True)
-    metadata = fields.NestedField(
+    # Filled server-side by copy_to from metadata.value, so the values are
+    # sent and stored once. A plain elasticsearch_dsl field, because
+    # django-elasticsearch-dsl would otherwise try to prepare it.
+    metadata_text = Text(analyzer=standard_text_analyzer, multi=True)
+    # A flat object rather than nested: nothing queries individual entries,
+    # and nested mapping would index every row as a hidden document.
+    metadata = fields.ObjectField(
         properties={
             "schema": fields.KeywordField(),
             "element": fields.KeywordField(),
             "qualifier": fields.KeywordField(),
-            "value": fields.TextField(analyzer=standard_text_analyzer),
+            "value": fields.TextField(analyzer=standard_text_analyzer, copy_to="metadata_text"),
             "language": fields.KeywordField(),
             "position": fields.IntegerField(),
         },
@@ -68,55 +121,79 @@ class PublicationDocument(Document):
     class Django:
         model = Publication
         fields = ()
+        # Signals keep single API/admin edits indexed (batched per transaction
+        # by PublicationSignalProcessor). The harvest command writes with
+        # bulk_create/bulk_update and a raw DELETE, none of which send model
+        # signals, and bulk-indexes the page itself.
         ignore_signals = False
-        auto_refresh = True
-        queryset_pagination = 100
+        # Let the index refresh_interval publish changes instead of forcing a
+        # refresh per save.
+        auto_refresh = False
+        # Chunk size for both the DB iterator and each bulk request during
+        # ``search_index --rebuild``; prefetches run once per chunk.
+        queryset_pagination = 1000
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related("metadata_entries")
-
-    def prepare_creator(self, instance: Publication):
-        return instance.metadata_values("creator")
-
-    def prepare_contributor(self, instance: Publication):
-        return instance.metadata_values("contributor")
-
-    def prepare_subject(self, instance: Publication):
-        return instance.metadata_values("subject")
-
-    def prepare_identifier(self, instance: Publication):
-        return instance.metadata_values("identifier")
-
-    def prepare_source(self, instance: Publication):
-        return instance.metadata_values("source")
-
-    def prepare_language(self, instance: Publication):
-        return instance.metadata_values("language")
-
-    def prepare_relation(self, instance: Publication):
-        return instance.metadata_values("relation")
-
-    def prepare_coverage(self, instance: Publication):
-        return instance.metadata_values("coverage")
-
-    def prepare_metadata_text(self, instance: Publication):
-        return [entry.value for entry in instance.metadata_entries.all()]
+        return super().get_queryset().select_related("journal")
+
+    def get_indexing_queryset(self):
+        # Rebuilds walk 1000-row chunks and load each chunk's metadata as
+        # tuples in one query; prepare() drops the rows as it consumes them.
+        instances = super().get_indexing_queryset()
+        while chunk := list(islice(instances, self.django.queryset_pagination)):
+            attach_metadata_rows(chunk)
+            yield from chunk
+
+    def prepare(self, instance: Publication):
+        # Walk the metadata rows and resolve the journal once per document,
+        # sharing the results with every prepare_* hook. Built fresh on each
+        # call and dropped after, so a re-index of the same instance (e.g. the
+        # post_save fired once the serializer has written metadata) never sees
+        # a stale cache.
+        entries = instance.__dict__.pop("_metadata_rows", None)
+        if entries is None:
+            entries = _metadata_rows([instance.pk])[instance.pk]
+        grouped: defaultdict[str, list[str]] = defaultdict(list)
+        rows: list[dict] = []
+        for schema, element, qualifier, value, language, position in entries:
+            rows.append({
+                "schema": schema,
+                "element": element,
+                "qualifier": qualifier,
+                "value": value,
+                "language": language,
+                "position": position,
+            })
+            if schema != "dc":
+                continue
+            value = (value or "").strip()
+            if value:
+                grouped[element].append(value)
+        journal = instance.journal
+        instance._md_cache = grouped
+        instance._md_rows = rows
+        instance._journal_fields = (journal.slug, journal.name) if journal else (None, None)
+        try:
+            return super().prepare(instance)
+        finally:
+            del instance._md_cache
+            del instance._md_rows
+            del instance._journal_fields
+
+    prepare_creator = _metadata_preparer("creator")
+    prepare_contributor = _metadata_preparer("contributor")
+    prepare_subject = _metadata_preparer("subject")
+    prepare_identifier = _metadata_preparer("identifier")
+    prepare_source = _metadata_preparer("source")
+    prepare_language = _metadata_preparer("language")
+    prepare_relation = _metadata_preparer("relation")
+    prepare_coverage = _metadata_preparer("coverage")
 
     def prepare_metadata(self, instance: Publication):
-        return [
-            {
-                "schema": entry.schema,
-                "element": entry.element,
-                "qualifier": entry.qualifier,
-                "value": entry.value,
-                "language": entry.language,
-                "position": entry.position,
-            }
-            for entry in instance.metadata_entries.all()
-        ]
+        return instance._md_rows
 
     def prepare_journal_slug(self, instance: Publication):
-        return instance.journal.slug if instance.journal else None
+        return instance._journal_fields[0]
 
     def prepare_journal_name(self, instance: Publication):
-        return instance.journal.name if instance.journal else None
+        return instance._journal_fields[1]
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from elasticsearch_dsl import Index
+
+# refresh_interval value that turns periodic refreshes off during bulk loads.
+REFRESH_DISABLED = "-1"
+
+
+def get_refresh_interval(index: Index) -> Optional[str]:
+    """Return the refresh_interval configured on ``index``, or None if unset.
+
+    A stored ``"-1"`` also counts as unset: it is only ever left behind by a
+    bulk load that was interrupted (or is still running), and restoring it
+    would stop the index from refreshing for good.
+    """
+    response = index.get_settings(name="index.refresh_interval")
+    for index_settings in getattr(response, "body", response).values():
+        interval = index_settings.get("settings", {}).get("index", {}).get("refresh_interval")
+        return None if interval == REFRESH_DISABLED else interval
+    return None
+
+
+def set_refresh_interval(index: Index, interval: Optional[str]) -> None:
+    """Set ``index``'s refresh_interval; None resets it to the Elasticsearch default."""
+    index.put_settings(body={"index": {"refresh_interval": interval}})
@@ -0,0 +1,108 @@
+import logging
+import threading
+import weakref
+
+from django.db import transaction
+from django_elasticsearch_dsl.apps import DEDConfig
+from django_elasticsearch_dsl.signals import RealTimeSignalProcessor
+
+from ..models import Publication, PublicationMetadata
+from .publication_index import INDEXED_MODEL_FIELDS, PublicationDocument, attach_metadata_rows
+
+logger = logging.getLogger(__name__)
+
+class _PendingReindexes(threading.local):
+    """Per-thread map of connection alias to the callback collecting its transaction.
+
+    References are weak: a rollback discards the registered callback, which
+    frees it and so drops it from here as well.
+    """
+
+    def __init__(self):
+        self.by_alias: dict[str, weakref.ref] = {}
+
+    def get(self, alias: str):
+        ref = self.by_alias.get(alias)
+        return ref() if ref is not None else None
+
+    def set(self, alias: str, pending: "_PendingReindex") -> None:
+        self.by_alias[alias] = weakref.ref(pending)
+
+    def discard(self, alias: str, pending: "_PendingReindex") -> None:
+        if self.get(alias) is pending:
+            del self.by_alias[alias]
+
+
+_pending_reindexes = _PendingReindexes()
+
+
+class _PendingReindex:
+    """``on_commit`` callback re-indexing the publications dirtied in a transaction."""
+
+    def __init__(self, alias: str):
+        self.alias = alias
+        self.publication_ids = set()
+
+    def __call__(self):
+        # Later saves on this connection belong to a new transaction.
+        _pending_reindexes.discard(self.alias, self)
+        document = PublicationDocument()
+        try:
+            publications = list(document.get_queryset().filter(pk__in=self.publication_ids))
+            if publications:
+                attach_metadata_rows(publications)
+                document.update(publications)
+        except Exception as exc:  # pylint: disable=broad-except
+            # The transaction has already committed; a search outage must
+            # not turn the request into an error.
+            logger.warning(
+                "Could not index %d publications: %s", len(self.publication_ids), exc)
+
+
+class PublicationSignalProcessor(RealTimeSignalProcessor):
+    """Real-time indexing that re-indexes each publication once per transaction.
+
+    Publication and metadata saves only mark the publication dirty; the
+    document is built and sent when the transaction commits, so a create that
+    saves the publication, writes its metadata and saves it again indexes the
+    final state once. A ``save(update_fields=...)`` touching none of the
+    indexed Publication columns is ignored. Like ``registry.update``, nothing
+    is queued while ``ELASTICSEARCH_DSL_AUTOSYNC`` is off or the document sets
+    ``ignore_signals``.
+    """
+
+    def handle_save(self, sender, instance, **kwargs):
+        if sender is Publication:
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None or not INDEXED_MODEL_FIELDS.isdisjoint(update_fields):
+                self._queue_reindex(instance.pk)
+            return
+        if sender is PublicationMetadata:
+            self._queue_reindex(instance.publication_id)
+            return
+        super().handle_save(sender, instance, **kwargs)
+
+    def handle_delete(self, sender, instance, **kwargs):
+        if sender is PublicationMetadata:
+            self._queue_reindex(instance.publication_id)
+            return
+        super().handle_delete(sender, instance, **kwargs)
+
+    @staticmethod
+    def _queue_reindex(publication_id):
+        if not DEDConfig.autosync_enabled() or PublicationDocument.django.ignore_signals:
+            return
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            # Join the callback already registered for this transaction, if
+            # it is still waiting to run.
+            pending = _pending_reindexes.get(connection.alias)
+            if pending is not None:
+                pending.publication_ids.add(publication_id)
+                return
+        pending = _PendingReindex(connection.alias)
+        pending.publication_ids.add(publication_id)
+        if connection.in_atomic_block:
+            _pending_reindexes.set(connection.alias, pending)
+        # Runs immediately in autocommit mode.
+        transaction.on_commit(pending, using=connection.alias)
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import re
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
@@ -27,6 +29,38 @@ from .utils import send_user_email
 
 User = get_user_model()
 
+# User columns UserAttributeSimilarityValidator compares a new password against.
+PASSWORD_SIMILARITY_FIELDS = ("email", "first_name", "last_name")
+
+
+def _create_unique_user(duplicate_message: str, **fields) -> User:
+    """``create_user`` that reports an email already in use as a field error.
+
+    The unique index on ``email`` is the only duplicate check, so signing up
+    costs the INSERT's own index probe rather than a SELECT before it.
+    """
+    try:
+        with transaction.atomic():
+            return User.objects.create_user(**fields)
+    except IntegrityError as exc:
+        raise serializers.ValidationError({"email": [duplicate_message]}) from exc
+
+
+@lru_cache(maxsize=1)
+def _blocked_email_domains(entries: tuple[str, ...]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Blocked domains and their ``.domain`` suffixes, built once per setting value."""
+    domains = frozenset(entry.strip().lower() for entry in entries)
+    return domains, tuple(f".{domain}" for domain in domains)
+
+
+def _get_token_with_user(token: str, token_type: str, *user_fields: str) -> UserToken:
+    """Load a token and its user, limited to the columns the caller reads or writes."""
+    return (
+        UserToken.objects.select_related("user")
+        .only("is_used", "expires_at", "user", *(f"user__{field}" for field in user_fields))
+        .get(token=token, token_type=token_type)
+    )
+
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -43,12 +77,11 @@ class RegistrationSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("email", "first_name", "last_name", "password")
+        # Duplicates are caught by the unique index in create().
+        extra_kwargs = {"email": {"validators": []}}
 
     def validate_email(self, value: str) -> str:
-        if User.objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError(
-                "A user with this email already exists")
-        return value
+        return User.objects.normalize_email(value)
 
     def validate(self, attrs):
         password = attrs.get("password")
@@ -58,7 +91,8 @@ class RegistrationSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         password = validated_data.pop("password", None)
-        user = User.objects.create_user(
+        user = _create_unique_user(
+            "A user with this email already exists",
             password=password, is_active=False, is_verified=False, **validated_data)
         token = UserToken.issue(user, UserToken.REGISTRATION, ttl_hours=24)
         send_user_email("verify", user, token)
@@ -70,8 +104,8 @@ class EmailVerificationSerializer(serializers.Serializer):
 
     def validate_token(self, value: str) -> str:
         try:
-            token = UserToken.objects.select_related("user").get(
-                token=value, token_type=UserToken.REGISTRATION)
+            token = _get_token_with_user(
+                value, UserToken.REGISTRATION, "is_active", "is_verified")
         except UserToken.DoesNotExist as exc:
             raise serializers.ValidationError("Invalid token") from exc
         if token.is_used:
@@ -95,8 +129,9 @@ class ResendVerificationSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
     def validate_email(self, value: str) -> str:
+        value = User.objects.normalize_email(value)
         try:
-            user = User.objects.get(email__iexact=value)
+            user = User.objects.get(email=value)
         except User.DoesNotExist as exc:
             raise serializers.ValidationError("Email not found") from exc
         if user.is_verified:
@@ -115,8 +150,9 @@ class PasswordResetRequestSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
     def validate_email(self, value: str) -> str:
+        value = User.objects.normalize_email(value)
         try:
-            user = User.objects.get(email__iexact=value)
+            user = User.objects.get(email=value)
         except User.DoesNotExist as exc:
             raise serializers.ValidationError("Email not found") from exc
         self.context["user"] = user
@@ -136,8 +172,9 @@ class PasswordResetSerializer(serializers.Serializer):
 
     def validate(self, attrs):
         try:
-            token = UserToken.objects.select_related("user").get(
-                token=attrs["token"], token_type=UserToken.RESET)
+            token = _get_token_with_user(
+                attrs["token"], UserToken.RESET,
+                "is_active", *PASSWORD_SIMILARITY_FIELDS)
         except UserToken.DoesNotExist as exc:
             raise serializers.ValidationError(
                 {"token": "Invalid token"}) from exc
@@ -163,16 +200,18 @@ class AdminInviteSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("email", "first_name", "last_name", "is_staff")
-        extra_kwargs = {"is_staff": {"required": False, "default": False}}
+        # Duplicate emails are caught by the unique index in create().
+        extra_kwargs = {
+            "email": {"validators": []},
+            "is_staff": {"required": False, "default": False},
+        }
 
     def validate_email(self, value: str) -> str:
-        if User.objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError(
-                "User with this email already exists")
-        return value
+        return User.objects.normalize_email(value)
 
     def create(self, validated_data):
-        user = User.objects.create_user(
+        user = _create_unique_user(
+            "User with this email already exists",
             is_active=False, is_verified=False, **validated_data)
         token = UserToken.issue(user, UserToken.INVITE, ttl_hours=48)
         send_user_email("invite", user, token)
@@ -185,7 +224,14 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
         fields = ("first_name", "last_name")
 
     def update(self, instance, validated_data):
-        return super().update(instance, validated_data)
+        if not validated_data:
+            return instance
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        # Write only the edited name columns (plus the auto_now stamp), not
+        # the whole user row.
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
 
 
 class InviteAcceptanceSerializer(serializers.Serializer):
@@ -194,8 +240,9 @@ class InviteAcceptanceSerializer(serializers.Serializer):
 
     def validate(self, attrs):
         try:
-            token = UserToken.objects.select_related("user").get(
-                token=attrs["token"], token_type=UserToken.INVITE)
+            token = _get_token_with_user(
+                attrs["token"], UserToken.INVITE,
+                "is_active", "is_verified", *PASSWORD_SIMILARITY_FIELDS)
         except UserToken.DoesNotExist as exc:
             raise serializers.ValidationError(
                 {"token": "Invalid token"}) from exc
@@ -336,6 +383,11 @@ class PublicationSerializer(serializers.ModelSerializer):
         "issued": {"schema": "dc", "element": "date", "qualifier": "issued", "type": "date"},
         "rights": {"schema": "dc", "element": "rights", "qualifier": "", "type": "string"},
     }
+    # (schema, element, qualifier) -> core field, for matching incoming entries.
+    _CORE_LOOKUP: dict[tuple[str, str, str], str] = {
+        (spec["schema"], spec["element"], spec["qualifier"] or ""): field
+        for field, spec in CORE_METADATA_FIELDS.items()
+    }
 
     class Meta:
         model = Publication
@@ -376,45 +428,88 @@ class PublicationSerializer(serializers.ModelSerializer):
         return None
 
     def create(self, validated_data):
-        metadata_payload_raw = list(validated_data.pop(
-            "metadata_entries", []) or [])
-        non_core_entries, core_entries = self._split_core_metadata(
-            metadata_payload_raw)
-        self._populate_missing_core_fields(validated_data, core_entries)
-        self._sanitize_core_fields(validated_data)
-        metadata_payload = self._build_metadata_payload(
-            non_core_entries, core_entries, validated_data)
+        metadata_payload = self._prepare_metadata_payload(validated_data)
+        publication = Publication(**validated_data)
+        entries = self.build_metadata_entries(publication, metadata_payload)
         with transaction.atomic():
-            publication = Publication.objects.create(**validated_data)
-            self._sync_metadata(publication, metadata_payload)
+            publication.save(force_insert=True)
+            if entries:
+                PublicationMetadata.bulk_create_normalized(entries)
         return publication
 
     def update(self, instance, validated_data):
-        metadata_payload_raw = validated_data.pop("metadata_entries", None)
         metadata_payload = None
-        if metadata_payload_raw is not None:
-            metadata_payload_raw = list(metadata_payload_raw or [])
-            non_core_entries, core_entries = self._split_core_metadata(
-                metadata_payload_raw)
-            self._populate_missing_core_fields(
-                validated_data, core_entries, instance=instance)
-            self._sanitize_core_fields(validated_data)
-            metadata_payload = self._build_metadata_payload(
-                non_core_entries, core_entries, validated_data)
+        if "metadata_entries" in validated_data:
+            metadata_payload = self._prepare_metadata_payload(
+                validated_data, instance=instance)
         else:
             self._sanitize_core_fields(validated_data)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        entries = None
+        if metadata_payload is not None:
+            entries = self.build_metadata_entries(instance, metadata_payload)
         with transaction.atomic():
-            for attr, value in validated_data.items():
-                setattr(instance, attr, value)
             instance.save()
-            if metadata_payload is not None:
-                instance.metadata_entries.all().delete()
-                self._sync_metadata(instance, metadata_payload)
+            if entries is not None:
+                self._replace_metadata(instance, entries)
             else:
                 self._update_core_metadata_fields(instance, validated_data)
         return instance
 
-    def _sync_metadata(self, publication: Publication, payload: list[dict]):
+    def _prepare_metadata_payload(self, validated_data: dict, instance: Publication | None = None) -> list[dict]:
+        metadata_payload_raw = list(validated_data.pop(
+            "metadata_entries", []) or [])
+        non_core_entries, core_entries = self._split_core_metadata(
+            metadata_payload_raw)
+        self._populate_missing_core_fields(
+            validated_data, core_entries, instance=instance)
+        self._sanitize_core_fields(validated_data)
+        return self._build_metadata_payload(
+            non_core_entries, core_entries, validated_data)
+
+    def _replace_metadata(self, publication: Publication, entries: list[PublicationMetadata]):
+        """Rewrite a publication's metadata, touching only the rows that changed.
+
+        Existing rows are matched to ``entries`` on (schema, element,
+        qualifier, position); matches keep their row and are updated only if
+        the value or language differs.
+        """
+        existing: dict[tuple, PublicationMetadata] = {}
+        stale_ids: list[int] = []
+        for entry in publication.metadata_entries.all():
+            key = (entry.schema, entry.element, entry.qualifier, entry.position)
+            if key in existing:
+                stale_ids.append(entry.pk)
+            else:
+                existing[key] = entry
+
+        now = timezone.now()
+        changed: list[PublicationMetadata] = []
+        created: list[PublicationMetadata] = []
+        for entry in entries:
+            entry.normalize()
+            current = existing.pop(
+                (entry.schema, entry.element, entry.qualifier, entry.position), None)
+            if current is None:
+                created.append(entry)
+            elif current.value != entry.value or current.language != entry.language:
+                current.value = entry.value
+                current.language = entry.language
+                # bulk_update skips auto_now.
+                current.updated_at = now
+                changed.append(current)
+        stale_ids.extend(entry.pk for entry in existing.values())
+
+        if stale_ids:
+            PublicationMetadata.objects.filter(id__in=stale_ids).delete()
+        if changed:
+            PublicationMetadata.objects.bulk_update(
+                changed, ["value", "language", "updated_at"], batch_size=1000)
+        if created:
+            PublicationMetadata.objects.bulk_create(created, batch_size=1000)
+
+    def build_metadata_entries(self, publication: Publication, payload: list[dict]) -> list[PublicationMetadata]:
         entries: list[PublicationMetadata] = []
         for index, item in enumerate(payload):
             schema = (item.get("schema") or "dc").strip()
@@ -441,9 +536,7 @@ class PublicationSerializer(serializers.ModelSerializer):
                         position, int) and position >= 0 else index,
                 )
             )
-
-        if entries:
-            PublicationMetadata.objects.bulk_create(entries)
+        return entries
 
     def _split_core_metadata(self, payload: list[dict]) -> tuple[list[dict], dict[str, list[dict]]]:
         non_core: list[dict] = []
@@ -518,15 +611,7 @@ class PublicationSerializer(serializers.ModelSerializer):
         return core_payload + non_core_entries
 
     def _match_core_field(self, schema: str, element: str, qualifier: str) -> str | None:
-        for field, spec in self.CORE_METADATA_FIELDS.items():
-            expected_qualifier = spec["qualifier"] or ""
-            if (
-                schema == spec["schema"]
-                and element == spec["element"]
-                and qualifier == expected_qualifier
-            ):
-                return field
-        return None
+        return self._CORE_LOOKUP.get((schema, element, qualifier))
 
     def _coerce_to_python(self, field: str, spec: dict[str, Any], value: Any) -> Any:
         field_type = spec.get("type")
@@ -556,36 +641,61 @@ class PublicationSerializer(serializers.ModelSerializer):
         return (value or "").strip()
 
     def _update_core_metadata_fields(self, publication: Publication, updates: dict) -> None:
-        for field, value in updates.items():
-            if field not in self.CORE_METADATA_FIELDS:
+        values = {
+            field: self._python_to_metadata(field, self.CORE_METADATA_FIELDS[field], value)
+            for field, value in updates.items()
+            if field in self.CORE_METADATA_FIELDS
+        }
+        if not values:
+            return
+
+        # Bucket the core rows per field in one pass over the entries (the
+        # viewset prefetches them, so this is usually free) and note the
+        # position after the last row that will be kept. Rows are stored
+        # lowercased, so exact matching is enough.
+        rows: dict[str, list[PublicationMetadata]] = {field: [] for field in values}
+        next_position = 0
+        for entry in publication.metadata_entries.all():
+            field = self._CORE_LOOKUP.get((entry.schema, entry.element, entry.qualifier))
+            if field in rows:
+                rows[field].append(entry)
+                if not values[field]:
+                    continue
+            next_position = max(next_position, entry.position + 1)
+
+        now = timezone.now()
+        to_update: list[PublicationMetadata] = []
+        to_create: list[PublicationMetadata] = []
+        to_delete: list[int] = []
+        for field, metadata_value in values.items():
+            if not metadata_value:
+                to_delete.extend(entry.pk for entry in rows[field])
+                continue
+            if rows[field]:
+                primary = rows[field][0]
+                if primary.value != metadata_value:
+                    primary.value = metadata_value
+                    primary.updated_at = now
+                    to_update.append(primary)
                 continue
             spec = self.CORE_METADATA_FIELDS[field]
-            metadata_value = self._python_to_metadata(field, spec, value)
-            qualifier = spec["qualifier"] or ""
-            queryset = publication.metadata_entries.filter(
-                schema__iexact=spec["schema"],
-                element__iexact=spec["element"],
-                qualifier__iexact=qualifier,
-            ).order_by("position", "id")
-
-            if metadata_value:
-                primary = queryset.first()
-                if primary:
-                    if primary.value != metadata_value:
-                        primary.value = metadata_value
-                        primary.save(update_fields=["value", "updated_at"])
-                else:
-                    PublicationMetadata.objects.create(
-                        publication=publication,
-                        schema=spec["schema"],
-                        element=spec["element"],
-                        qualifier=qualifier,
-                        value=metadata_value,
-                        language="",
-                        position=publication.metadata_entries.count(),
-                    )
-            else:
-                queryset.delete()
+            to_create.append(PublicationMetadata(
+                publication=publication,
+                schema=spec["schema"],
+                element=spec["element"],
+                qualifier=spec["qualifier"] or "",
+                value=metadata_value,
+                language="",
+                position=next_position,
+            ))
+            next_position += 1
+
+        if to_delete:
+            PublicationMetadata.objects.filter(id__in=to_delete).delete()
+        if to_update:
+            PublicationMetadata.objects.bulk_update(to_update, ["value", "updated_at"])
+        if to_create:
+            PublicationMetadata.objects.bulk_create(to_create)
 
 
 class ResearcherExperienceSerializer(serializers.ModelSerializer):
@@ -777,16 +887,14 @@ class ResearcherProfileWriteSerializer(serializers.ModelSerializer):
         if not local_part or not domain:
             raise serializers.ValidationError(
                 "Institutional email must include a domain.")
-        blocked_domains = {
-            entry.lower()
-            for entry in getattr(settings, "INSTITUTIONAL_EMAIL_BLOCKED_DOMAINS", [])
-        }
-        if any(domain == blocked or domain.endswith(f".{blocked}") for blocked in blocked_domains):
+        blocked_domains, blocked_suffixes = _blocked_email_domains(
+            tuple(getattr(settings, "INSTITUTIONAL_EMAIL_BLOCKED_DOMAINS", ())))
+        if domain in blocked_domains or domain.endswith(blocked_suffixes):
             raise serializers.ValidationError(
                 "Institutional email cannot use personal email providers (e.g., Gmail)."
             )
         queryset = ResearcherProfile.objects.filter(
-            institutional_email__iexact=normalized
+            institutional_email=normalized
         )
         if self.instance is not None:
             queryset = queryset.exclude(pk=self.instance.pk)
@@ -1,10 +1,14 @@
 from datetime import date, timedelta
+from io import StringIO
 from types import SimpleNamespace
 from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.management import call_command
+from django.db import DataError, connections, transaction
+from django.test import override_settings
 from django.urls import reverse
 from elasticsearch.exceptions import TransportError
 from rest_framework import status
@@ -12,11 +16,16 @@ from rest_framework.test import APITestCase
 
 from .models import (
     Journal,
+    OAIHarvestLog,
     Publication,
+    PublicationMetadata,
     ResearcherInstitutionalEmailToken,
     ResearcherProfile,
     UserToken,
 )
+from .oai import OAIClientError
+from .search.publication_index import PublicationDocument
+from .search.signals import PublicationSignalProcessor, _PendingReindex
 
 
 User = get_user_model()
@@ -59,6 +68,17 @@ class AuthenticationTests(APITestCase):
         self.assertTrue(user.is_active)
         self.assertTrue(user.is_verified)
 
+    def test_registration_stores_email_lowercased(self):
+        payload = {"email": "  Erin@Example.COM ", "password": "Secretpass123"}
+        response = self.client.post(reverse("auth-register"), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(User.objects.filter(email="erin@example.com").exists())
+
+        payload["email"] = "ERIN@example.com"
+        duplicate = self.client.post(reverse("auth-register"), payload, format="json")
+        self.assertEqual(duplicate.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", duplicate.data)
+
     def test_login_requires_verified_email(self):
         user = User.objects.create_user(
             email="bob@example.com", password="Secretpass123", is_active=False)
@@ -491,9 +511,12 @@ class ResearcherProfileTests(APITestCase):
     def test_user_can_create_profile_with_institutional_email(self):
         self.authenticate()
         payload = self._create_profile_payload()
-        response = self.client.post(
-            reverse("researcher-list"), payload, format="json"
-        )
+        # Deliver inline once the request's transaction "commits".
+        with patch("api.utils._send_in_background", side_effect=lambda send, *args: send(*args)), \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("researcher-list"), payload, format="json"
+            )
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         profile = ResearcherProfile.objects.get(user=self.user)
@@ -669,6 +692,41 @@ class PublicationApiTests(APITestCase):
             payload, dict) and "results" in payload else payload
         self.assertGreaterEqual(len(items), 1)
 
+    def test_metadata_update_only_rewrites_changed_rows(self):
+        self.client.force_authenticate(user=self.admin)
+        payload = {
+            "title": "Incremental Metadata",
+            "metadata": [
+                {"schema": "dc", "element": "creator", "value": "Omondi, Peter"},
+                {"schema": "dc", "element": "subject", "value": "Archives"},
+                {"schema": "dc", "element": "relation", "value": "Series A"},
+            ],
+        }
+        response = self.client.post(reverse("publication-list"), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        publication = Publication.objects.get(pk=response.data["id"])
+        before = {
+            (entry.element, entry.value): entry.pk
+            for entry in publication.metadata_entries.all()
+        }
+        subject_edited_at = publication.metadata_entries.get(element="subject").updated_at
+
+        payload["metadata"][1]["value"] = "Digital archives"
+        del payload["metadata"][2]
+        response = self.client.put(
+            reverse("publication-detail", args=[publication.slug]), payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        after = {
+            (entry.element, entry.value): entry.pk
+            for entry in publication.metadata_entries.all()
+        }
+        self.assertEqual(after[("creator", "Omondi, Peter")], before[("creator", "Omondi, Peter")])
+        self.assertEqual(after[("subject", "Digital archives")], before[("subject", "Archives")])
+        self.assertNotIn("relation", {element for element, _ in after})
+        self.assertGreater(
+            publication.metadata_entries.get(element="subject").updated_at, subject_edited_at)
+
     def test_only_admin_can_manage_publication(self):
         payload = {
             "title": "Digital Repositories in Africa",
@@ -747,3 +805,313 @@ class PublicationApiTests(APITestCase):
         delete_response = self.client.delete(detail_url)
         self.assertEqual(delete_response.status_code,
                          status.HTTP_204_NO_CONTENT)
+
+
+class HarvestOAICommandTests(APITestCase):
+    RECORD_TEMPLATE = """
+        <record>
+          <header>
+            <identifier>{identifier}</identifier>
+            <datestamp>{datestamp}</datestamp>
+          </header>
+          <metadata>
+            <oai_dc:dc xmlns:oai_dc="http://www.openarchives.org/OAI/2.0/oai_dc/"
+                       xmlns:dc="http://purl.org/dc/elements/1.1/">
+              <dc:title>{title}</dc:title>
+              <dc:creator>Otieno, Mary</dc:creator>
+              <dc:creator>Kamau, John</dc:creator>
+              <dc:subject>Information science</dc:subject>
+              <dc:description>An abstract.</dc:description>
+              <dc:date>2024-03-01</dc:date>
+              <dc:language>en</dc:language>
+            </oai_dc:dc>
+          </metadata>
+        </record>
+    """
+
+    def setUp(self):
+        self.journal = Journal.objects.create(
+            name="East African Library Journal",
+            oai_url="https://example.org/oai",
+        )
+
+    def _payload(self, *records: dict, resumption_token: str = "") -> bytes:
+        body = "".join(self.RECORD_TEMPLATE.format(**record)
+                       for record in records)
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+            f"<ListRecords>{body}"
+            f"<resumptionToken>{resumption_token}</resumptionToken>"
+            "</ListRecords>"
+            "</OAI-PMH>"
+        ).encode("utf-8")
+
+    def _harvest(self, payload: bytes):
+        with patch("api.management.commands.harvest_oai.fetch_oai_response", return_value=payload), \
+                patch("api.management.commands.harvest_oai.PublicationDocument"):
+            call_command("harvest_oai", self.journal.slug, stdout=StringIO())
+
+    def test_harvest_creates_and_updates_publications(self):
+        self._harvest(self._payload(
+            {"identifier": "oai:example.org:1",
+                "datestamp": "2024-03-01T10:00:00Z", "title": "First Article"},
+            {"identifier": "oai:example.org:2",
+                "datestamp": "2024-03-02T10:00:00Z", "title": "Second Article"},
+        ))
+
+        self.assertEqual(Publication.objects.count(), 2)
+        publication = Publication.objects.get(
+            oai_identifier="oai:example.org:1")
+        self.assertEqual(publication.journal, self.journal)
+        self.assertEqual(publication.issued, date(2024, 3, 1))
+        self.assertEqual(publication.metadata_values("creator"),
+                         ["Otieno, Mary", "Kamau, John"])
+        self.assertEqual(publication.metadata_values("title"),
+                         ["First Article"])
+        self.journal.refresh_from_db()
+        self.assertEqual(self.journal.last_harvested_at.isoformat(),
+                         "2024-03-02T10:00:00+00:00")
+        log = OAIHarvestLog.objects.get(journal=self.journal)
+        self.assertEqual(log.status, OAIHarvestLog.Status.SUCCESS)
+        self.assertEqual(log.record_count, 2)
+
+        self._harvest(self._payload(
+            {"identifier": "oai:example.org:1",
+                "datestamp": "2024-04-01T10:00:00Z", "title": "First Article Revised"},
+            {"identifier": "oai:example.org:2",
+                "datestamp": "2024-03-02T10:00:00Z", "title": "Stale Title"},
+        ))
+
+        self.assertEqual(Publication.objects.count(), 2)
+        publication.refresh_from_db()
+        self.assertEqual(publication.title, "First Article Revised")
+        self.assertEqual(publication.metadata_entries.filter(
+            element="creator").count(), 2)
+        self.assertEqual(Publication.objects.get(
+            oai_identifier="oai:example.org:2").title, "Second Article")
+
+    @override_settings(ELASTICSEARCH_DSL_AUTOSYNC=True)
+    def test_reharvest_does_not_queue_signal_reindexing(self):
+        record = {"identifier": "oai:example.org:1",
+                  "datestamp": "2024-03-01T10:00:00Z", "title": "First Article"}
+        self._harvest(self._payload(record))
+        processor = PublicationSignalProcessor(connections)
+        self.addCleanup(processor.teardown)
+
+        record.update(datestamp="2024-04-01T10:00:00Z", title="First Article Revised")
+        with self.captureOnCommitCallbacks() as callbacks:
+            self._harvest(self._payload(record))
+
+        self.assertEqual(Publication.objects.get().title, "First Article Revised")
+        self.assertFalse(any(isinstance(callback, _PendingReindex) for callback in callbacks))
+
+    def test_oversized_record_is_skipped_without_failing_the_page(self):
+        self._harvest(self._payload(
+            {"identifier": "oai:example.org:1",
+                "datestamp": "2024-03-01T10:00:00Z", "title": "First Article"},
+            {"identifier": "oai:example.org:" + "9" * 600,
+                "datestamp": "2024-03-02T10:00:00Z", "title": "Oversized Identifier"},
+            {"identifier": "oai:example.org:3",
+                "datestamp": "2024-03-03T10:00:00Z", "title": "Third Article"},
+        ))
+
+        self.assertEqual(
+            sorted(Publication.objects.values_list("title", flat=True)),
+            ["First Article", "Third Article"])
+        log = OAIHarvestLog.objects.get(journal=self.journal)
+        self.assertEqual(log.status, OAIHarvestLog.Status.SUCCESS)
+        self.assertEqual(log.record_count, 2)
+
+    def test_record_rejected_by_database_is_skipped(self):
+        bulk_create = PublicationMetadata.bulk_create_normalized.__func__
+
+        def reject_one_record(cls, entries, *args, **kwargs):
+            # Stand-in for MySQL strict mode refusing an over-long value.
+            entries = list(entries)
+            if any(entry.value == "Rejected Article" for entry in entries):
+                raise DataError("Data too long for column 'value'")
+            return bulk_create(cls, entries, *args, **kwargs)
+
+        with patch.object(PublicationMetadata, "bulk_create_normalized",
+                          classmethod(reject_one_record)):
+            self._harvest(self._payload(
+                {"identifier": "oai:example.org:1",
+                    "datestamp": "2024-03-01T10:00:00Z", "title": "First Article"},
+                {"identifier": "oai:example.org:2",
+                    "datestamp": "2024-03-02T10:00:00Z", "title": "Rejected Article"},
+                {"identifier": "oai:example.org:3",
+                    "datestamp": "2024-03-03T10:00:00Z", "title": "Third Article"},
+            ))
+
+        self.assertEqual(
+            sorted(Publication.objects.values_list("title", flat=True)),
+            ["First Article", "Third Article"])
+        self.assertEqual(
+            Publication.objects.get(
+                oai_identifier="oai:example.org:3").metadata_values("creator"),
+            ["Otieno, Mary", "Kamau, John"])
+        log = OAIHarvestLog.objects.get(journal=self.journal)
+        self.assertEqual(log.status, OAIHarvestLog.Status.SUCCESS)
+        self.assertEqual(log.record_count, 2)
+
+    def test_harvest_restores_the_configured_refresh_interval(self):
+        cases = (
+            ({"refresh_interval": "30s"}, "30s"),
+            ({}, None),
+            # Left behind by an interrupted run; must not be restored.
+            ({"refresh_interval": "-1"}, None),
+        )
+        for configured, restored in cases:
+            with self.subTest(configured=configured), \
+                    patch("api.management.commands.harvest_oai.fetch_oai_response",
+                          return_value=self._payload()), \
+                    patch("api.management.commands.harvest_oai.PublicationDocument") as document:
+                document._index.get_settings.return_value = {
+                    "publications": {"settings": {"index": configured}}}
+                call_command("harvest_oai", self.journal.slug, stdout=StringIO())
+
+            self.assertEqual(
+                [call.kwargs["body"]["index"]["refresh_interval"]
+                 for call in document._index.put_settings.call_args_list],
+                ["-1", restored],
+            )
+
+    def test_failed_fetch_is_logged_as_failure(self):
+        with patch("api.management.commands.harvest_oai.fetch_oai_response",
+                   side_effect=OAIClientError("connection refused")), \
+                patch("api.management.commands.harvest_oai.PublicationDocument"):
+            call_command("harvest_oai", self.journal.slug,
+                         stdout=StringIO(), stderr=StringIO())
+
+        log = OAIHarvestLog.objects.get(journal=self.journal)
+        self.assertEqual(log.status, OAIHarvestLog.Status.FAILED)
+        self.assertIn("connection refused", log.error_message)
+        self.assertIsNotNone(log.finished_at)
+        self.assertEqual(Publication.objects.count(), 0)
+
+    def test_harvest_indexes_each_page_as_it_is_stored(self):
+        pages = [
+            self._payload(
+                {"identifier": "oai:example.org:1",
+                    "datestamp": "2024-03-01T10:00:00Z", "title": "First Article"},
+                resumption_token="page-2",
+            ),
+            self._payload(
+                {"identifier": "oai:example.org:2",
+                    "datestamp": "2024-03-02T10:00:00Z", "title": "Second Article"},
+            ),
+        ]
+        with patch("api.management.commands.harvest_oai.fetch_oai_response", side_effect=pages), \
+                patch("api.management.commands.harvest_oai.PublicationDocument") as document:
+            call_command("harvest_oai", self.journal.slug, stdout=StringIO())
+
+        indexed = [
+            [publication.title for publication in call.args[0]]
+            for call in document.return_value.update.call_args_list
+        ]
+        self.assertEqual(indexed, [["First Article"], ["Second Article"]])
+
+    def test_parse_oai_records_streams_records_and_resumption_token(self):
+        from api.management.commands.harvest_oai import Command
+
+        payload = self._payload(
+            {"identifier": "oai:example.org:1",
+                "datestamp": "2024-03-01", "title": "First Article"},
+            resumption_token=" next-page ",
+        )
+        records, token = Command()._parse_oai_records(payload)
+
+        self.assertEqual(token, "next-page")
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["identifier"], "oai:example.org:1")
+        self.assertEqual(records[0]["values"]["creator"],
+                         ["Otieno, Mary", "Kamau, John"])
+
+
+class RebuildSearchIndexCommandTests(APITestCase):
+    def test_rebuild_disables_refresh_during_load_and_restores_it(self):
+        with patch("api.management.commands.rebuild_search_index.PublicationDocument") as document:
+            document.return_value.get_queryset.return_value.count.return_value = 0
+            document._index.get_settings.return_value = {
+                "publications": {"settings": {"index": {"refresh_interval": "30s"}}}}
+            call_command("rebuild_search_index", stdout=StringIO())
+
+        index = document._index
+        index.create.assert_called_once()
+        self.assertEqual(
+            [call.kwargs["body"]["index"]["refresh_interval"]
+             for call in index.put_settings.call_args_list],
+            ["-1", "30s"],
+        )
+        index.refresh.assert_called_once()
+        self.assertTrue(document.return_value.update.call_args.kwargs["parallel"])
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=True)
+class PublicationSignalProcessorTests(APITestCase):
+    def setUp(self):
+        processor = PublicationSignalProcessor(connections)
+        self.addCleanup(processor.teardown)
+
+    def _create_publication(self):
+        publication = Publication.objects.create(title="Quiet Indexing")
+        publication.metadata_entries.create(
+            schema="dc", element="creator", value="Doe, Jane")
+        publication.save()
+        return publication
+
+    def test_publication_is_indexed_once_per_transaction(self):
+        with patch("api.search.signals.PublicationDocument.update") as update:
+            with self.captureOnCommitCallbacks(execute=True):
+                publication = Publication.objects.create(title="Batched Indexing")
+                publication.metadata_entries.create(
+                    schema="dc", element="creator", value="Doe, Jane")
+                publication.metadata_entries.create(
+                    schema="dc", element="subject", value="Indexing")
+                publication.title = "Batched Indexing, Revised"
+                publication.save(update_fields=["title"])
+                update.assert_not_called()
+
+        update.assert_called_once()
+        (indexed,), _ = update.call_args
+        self.assertEqual([p.pk for p in indexed], [publication.pk])
+        self.assertEqual(len(indexed[0]._metadata_rows), 2)
+
+    def test_rolled_back_savepoint_does_not_swallow_later_saves(self):
+        with patch("api.search.signals.PublicationDocument.update") as update:
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertRaises(DataError):
+                    with transaction.atomic():
+                        Publication.objects.create(title="Rolled Back")
+                        raise DataError("rejected")
+                publication = Publication.objects.create(title="Kept")
+
+        update.assert_called_once()
+        (indexed,), _ = update.call_args
+        self.assertEqual([p.pk for p in indexed], [publication.pk])
+
+    def test_indexing_failure_is_logged_not_raised(self):
+        with patch("api.search.signals.PublicationDocument.update",
+                   side_effect=ConnectionError("search is down")), \
+                self.assertLogs("api.search.signals", level="WARNING"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._create_publication()
+
+    @override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+    def test_nothing_is_indexed_when_autosync_is_disabled(self):
+        with patch("api.search.signals.PublicationDocument.update") as update:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self._create_publication()
+
+        self.assertEqual(callbacks, [])
+        update.assert_not_called()
+
+    def test_nothing_is_indexed_when_document_ignores_signals(self):
+        with patch.object(PublicationDocument.django, "ignore_signals", True), \
+                patch("api.search.signals.PublicationDocument.update") as update:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self._create_publication()
+
+        self.assertEqual(callbacks, [])
+        update.assert_not_called()
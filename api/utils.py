@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Literal, TYPE_CHECKING
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Literal, TYPE_CHECKING
 
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db import connections, transaction
 from django.template.loader import render_to_string
 
 from .models import User, UserToken
@@ -13,6 +16,11 @@ if TYPE_CHECKING:
 
 EmailTemplate = Literal["verify", "reset", "invite"]
 
+logger = logging.getLogger(__name__)
+
+# Small pool so requests hand mail off instead of waiting on SMTP.
+_mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mail")
+
 
 def build_frontend_url(path: str) -> str:
     base_url = getattr(settings, "FRONTEND_BASE_URL", "http://localhost:4200")
@@ -66,3 +74,24 @@ def send_institutional_email_verification(
         [token.email],
         html_message=html_message,
     )
+
+
+def _send_in_background(send: Callable[..., None], *args) -> None:
+    def run() -> None:
+        try:
+            send(*args)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Background email delivery failed")
+        finally:
+            connections.close_all()
+
+    _mail_executor.submit(run)
+
+
+def queue_institutional_email_verification(
+    profile: "ResearcherProfile",
+    token: "ResearcherInstitutionalEmailToken",
+) -> None:
+    """Send the verification mail off the request thread once the token is committed."""
+    transaction.on_commit(
+        lambda: _send_in_background(send_institutional_email_verification, profile, token))
@@ -576,8 +576,8 @@ class PublicationViewSet(viewsets.ModelViewSet):
                 subject_query = Q()
                 for term in terms:
                     subject_query |= Q(
-                        metadata_entries__schema__iexact="dc",
-                        metadata_entries__element__iexact="subject",
+                        metadata_entries__schema="dc",
+                        metadata_entries__element="subject",
                         metadata_entries__value__icontains=term,
                     )
                 if subject_query:
@@ -596,8 +596,8 @@ class PublicationViewSet(viewsets.ModelViewSet):
             author_query = Q()
             for author_value in author_terms:
                 author_query |= Q(
-                    metadata_entries__schema__iexact="dc",
-                    metadata_entries__element__iexact="creator",
+                    metadata_entries__schema="dc",
+                    metadata_entries__element="creator",
                     metadata_entries__value__iexact=author_value,
                 )
             if author_query:
@@ -611,8 +611,8 @@ class PublicationViewSet(viewsets.ModelViewSet):
     def _get_author_facets_queryset(self, queryset):
         metadata_qs = PublicationMetadata.objects.filter(
             publication__in=queryset,
-            schema__iexact="dc",
-            element__iexact="creator",
+            schema="dc",
+            element="creator",
         ).annotate(
             normalized_value=Lower(Trim("value")),
             raw_label=Trim("value"),
@@ -626,8 +626,8 @@ class PublicationViewSet(viewsets.ModelViewSet):
     def _get_subject_facets_queryset(self, queryset):
         metadata_qs = PublicationMetadata.objects.filter(
             publication__in=queryset,
-            schema__iexact="dc",
-            element__iexact="subject",
+            schema="dc",
+            element="subject",
         ).annotate(
             normalized_value=Lower(Trim("value")),
             raw_label=Trim("value"),
@@ -1426,7 +1426,7 @@ class PublicationSearchView(PublicationSearchFacetMixin, APIView):
 
         hit_ids = [str(hit.meta.id) for hit in hits]
         publications = Publication.objects.filter(
-            id__in=hit_ids).prefetch_related("metadata_entries")
+            id__in=hit_ids).select_related("journal").prefetch_related("metadata_entries")
         publication_map = {str(pub.id): pub for pub in publications}
         ordered_publications = [publication_map[pk]
                                 for pk in hit_ids if pk in publication_map]